@@ -1,17 +1,28 @@
-from flask import Flask, render_template, request, jsonify, session, redirect
+from flask import Flask, render_template, request, jsonify, redirect
 from flask_cors import CORS
+import math
 import random
-import requests
+import unicodedata
+from bisect import bisect_left
+from collections import Counter
 import os
-from datetime import datetime
+from datetime import date, datetime, timedelta, timezone
 from dotenv import load_dotenv
-from supabase import create_client
-from wordLists import WORDS
-from functools import wraps
 
-# Load environment variables
+# Load environment variables before the modules below read their WURDLE_* settings
 load_dotenv()
 
+from wordStore import WORDS, preload as preload_words, resolve_guess
+from feedbackCodes import decode_pattern, pattern_code
+from dailyWords import daily_index, puzzle_number, today
+from gameState import GameState, load_game, save_game
+from leaderboard import LEADERBOARD_SIZE, LeaderboardCache
+from scoreWriter import ScoreWriter
+from rankIndex import RankIndex
+from scoreStore import create_score_store
+from httpClients import HTTP_TIMEOUT, session as http_session
+from functools import wraps
+
 app = Flask(__name__)
 
 CORS(app, 
@@ -33,9 +44,17 @@ app.secret_key = os.getenv('FLASK_SECRET_KEY', 'your_secret_key')
 app.config['SESSION_COOKIE_SAMESITE'] = 'None'
 app.config['SESSION_COOKIE_SECURE'] = True
 
-# Initialize Supabase
-supabase_url = os.getenv('SUPABASE_URL')
-supabase_key = os.getenv('SUPABASE_KEY')
+# Comma separated languages to load at boot instead of on first use, e.g. WURDLE_PRELOAD_LANGUAGES=en
+preload_words([language for language in os.getenv('WURDLE_PRELOAD_LANGUAGES', '').split(',') if language])
+
+# Same bytes for every rejected guess, so it is built once and can be cached
+NOT_A_WORD_RESPONSE = b'{"valid":false}'
+
+SCORES_PAGE_SIZE = 50
+MAX_SCORES_PAGE_SIZE = 200
+
+# Invalid guesses do not use up a turn, so a batch may hold more than six entries
+MAX_BATCH_GUESSES = 50
 
 # Remove Microsoft OAuth configuration
 # MS_CLIENT_ID = os.getenv('MS_CLIENT_ID')
@@ -46,11 +65,90 @@ supabase_key = os.getenv('SUPABASE_KEY')
 # SCOPES = ['User.Read']
 # AUTHORITY = f'https://login.microsoftonline.com/{MS_TENANT_ID}'
 
-if not all([supabase_url, supabase_key]): # Removed MS variables
-    raise Exception("Missing required environment variables")
+# Scores live in Supabase when SUPABASE_URL and SUPABASE_KEY are set, else in a local SQLite file
+scores = create_score_store()
 
-# Initialize Supabase
-supabase = create_client(supabase_url, supabase_key)
+def board_length(language, word_length):
+    # The canonical word length ('5') of a real word bucket, or None. Only these boards are queried, cached
+    # and stored, so spellings like '05' never open a board of their own
+    if language not in WORDS:
+        return None
+    word_length = str(word_length)
+    return word_length if word_length in {str(length) for length in WORDS[language]} else None
+
+# {word_length: modes} of each language's buckets that have words, built the first time the language is asked for
+_playable = {}
+
+def playable_buckets(language):
+    playable = _playable.get(language)
+    if playable is None:
+        lengths = {length: [mode for mode, words in modes.items() if len(words)]
+                   for length, modes in sorted(WORDS[language].items())}
+        playable = _playable.setdefault(language, {length: modes for length, modes in lengths.items() if modes})
+    return playable
+
+def fetch_board(language, word_length):
+    rows = scores.top(language, word_length, LEADERBOARD_SIZE)
+    if score_writer is None:
+        return rows
+    # Scores still waiting in the write-behind queue belong on the board too
+    rows = rows + score_writer.pending(language, word_length)
+    return sorted(rows, key=lambda score: score['time'])[:LEADERBOARD_SIZE]
+
+def fetch_snapshot(language):
+    # Every board of a language, or of all languages when language is None, from one query
+    rows = scores.boards(language, LEADERBOARD_SIZE)
+    if score_writer is not None:
+        rows = sorted(rows + score_writer.pending(language), key=lambda score: score['time'])
+    snapshot = {}
+    for row in rows:
+        board = snapshot.setdefault(row['language'], {}).setdefault(str(row['word_length']), [])
+        if len(board) < LEADERBOARD_SIZE:
+            board.append(row)
+    return snapshot
+
+def trim_boards(rows):
+    # After a batch insert, each touched board holds at most its top 20 plus the rows added to it; the
+    # rows below the top 20 are deleted by id, so ties at the cutoff never leave extra rows behind
+    for (language, word_length), added in Counter((row['language'], row['word_length']) for row in rows).items():
+        displaced = scores.top(language, word_length, LEADERBOARD_SIZE + added)[LEADERBOARD_SIZE:]
+        if displaced:
+            scores.delete([row['id'] for row in displaced])
+
+# Top-20 boards served from memory, refreshed in the background
+leaderboards = LeaderboardCache(fetch_board, fetch_snapshot)
+
+def record_history(entry):
+    # Best effort: the leaderboard is already written, a failing history or unbuilt index only leaves
+    # the overall standing out of the response
+    try:
+        queued = time_writer is not None and time_writer.submit(dict(entry))
+        if not queued:
+            for row in scores.add_times([entry]):
+                ranks.add(row)
+        language, word_length = entry['language'], entry['word_length']
+        pending = [row['time'] for row in time_writer.pending(language, word_length)] if queued else ()
+        standing = ranks.rank(language, word_length, entry['time'], pending)
+    except Exception as e:
+        print(f"Error recording score history: {str(e)}")
+        return {}
+    if standing is None:
+        return {}
+    overall_rank, players, percentile = standing
+    return {'overall_rank': overall_rank, 'players': players, 'percentile': percentile}
+
+def index_times(rows):
+    for row in rows:
+        ranks.add(row)
+
+# Ranks and percentiles over every submitted time
+ranks = RankIndex(scores.times_since)
+ranks.start()
+
+# Optional write-behind of score and history inserts, batched by background threads
+write_behind = os.getenv('WURDLE_SCORE_WRITE_BEHIND') == '1'
+score_writer = ScoreWriter(scores.insert, trim_boards) if write_behind else None
+time_writer = ScoreWriter(scores.add_times, index_times) if write_behind else None
 
 # Removed MSAL initialization
 # msal_app = ConfidentialClientApplication(
@@ -158,6 +256,16 @@ supabase = create_client(supabase_url, supabase_key)
 def home():
     return render_template('index.html')
 
+@app.route('/word_buckets/<language>')
+def word_buckets(language):
+    # Lengths and modes that have words, so the setup form never offers an empty bucket. Only the asked
+    # for language's index is loaded
+    if language not in WORDS:
+        return jsonify({'error': 'Unknown language'}), 404
+    response = jsonify(playable_buckets(language))
+    response.headers['Cache-Control'] = 'public, max-age=3600'
+    return response
+
 @app.route('/start_game', methods=['POST'])
 #@login_required
 def start_game():
@@ -169,48 +277,88 @@ def start_game():
     if language not in WORDS:
         language = 'en'
     
-    target_word = random.choice(WORDS[language][word_length][mode])
-    session['target_word'] = target_word
-    session['language'] = language
-    session['guesses'] = []
-    session['start_time'] = datetime.now().timestamp()
+    words = WORDS[language][word_length][mode]
+    if not words:
+        return jsonify({'error': 'No words available for this length and mode'}), 400
+
+    daily = None
+    if data.get('daily'):
+        day = today()
+        target = daily_index(language, word_length, mode, day)
+        daily = puzzle_number(day)
+    else:
+        # Optional difficulty band ('easy', 'medium', 'hard') from the prebuilt difficulty index. difficulty
+        # imports NumPy for its offline build, so it is only imported when a band is asked for
+        target = None
+        if data.get('difficulty'):
+            from difficulty import pick_index
+            target = pick_index(language, word_length, mode, data['difficulty'])
+        if target is None:
+            target = random.randrange(len(words))
+    state = GameState(language, word_length, mode, target, daily=daily)
+    save_game(state)
     
     return jsonify({
         'status': 'ready',
-        'target_word': target_word
+        'target_word': state.target_word
     })
 
+@app.route('/daily/<language>/<int:word_length>/<mode>')
+@app.route('/daily/<language>/<int:word_length>/<mode>/<day>')
+def daily(language, word_length, mode, day=None):
+    if language not in WORDS or not WORDS[language].get(word_length, {}).get(mode):
+        return jsonify({'error': 'No daily puzzle for this language, length and mode'}), 404
+
+    try:
+        puzzle_day = date.fromisoformat(day) if day else today()
+    except ValueError:
+        return jsonify({'error': 'Dates are YYYY-MM-DD'}), 400
+
+    response = jsonify({
+        'date': puzzle_day.isoformat(),
+        'puzzle': puzzle_number(puzzle_day),
+        'language': language,
+        'wordLength': word_length,
+        'mode': mode
+    })
+    if day:
+        # A dated puzzle never changes
+        response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    else:
+        now = datetime.now(timezone.utc)
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time(), timezone.utc)
+        seconds = int((midnight - now).total_seconds())
+        response.headers['Cache-Control'] = f'public, max-age={seconds}, s-maxage={seconds}'
+    return response
+
 @app.route('/submit_guess', methods=['POST'])
 def submit_guess():
     try:
-        language = session.get('language', 'en')
-        target_word = session.get('target_word', '').lower()
+        state = load_game()
         
-        if not target_word:
+        if state is None:
             return jsonify({"error": "No active game"}), 400
+        if state.finished:
+            return jsonify({"error": "Game over"}), 400
 
-        guess = request.json.get('guess', '').lower()
-        
-        feedback = compare_words(guess, target_word)
-        
-        if 'guesses' not in session:
-            session['guesses'] = []
-        session['guesses'].append({'guess': guess, 'feedback': feedback})
+        feedback = play_guess(state, request.json.get('guess', ''))
 
-        is_sixth_guess = len(session['guesses']) >= 6
-        is_correct = guess == target_word
+        if feedback is None:
+            response = app.response_class(NOT_A_WORD_RESPONSE, mimetype='application/json')
+            response.headers['Cache-Control'] = 'public, max-age=86400'
+            return response
         
+        save_game(state)
+
         response_data = {
             'feedback': feedback,
-            'guesses': session['guesses'],
-            'game_over': is_sixth_guess or is_correct,
+            'guess_count': state.guess_count,
+            'game_over': state.finished,
         }
         
-        if is_correct:
-            end_time = datetime.now().timestamp()
-            time_taken = end_time - session['start_time']
+        if state.solved:
             response_data.update({
-                'time_taken': time_taken,
+                'time_taken': state.elapsed(),
                 'correct': True
             })
 
@@ -222,6 +370,48 @@ def submit_guess():
         traceback.print_exc()
         return jsonify({"error": str(e)}), 500
 
+@app.route('/submit_guesses', methods=['POST'])
+def submit_guesses():
+    # Plays an ordered batch of guesses against the active game in one round trip, for replays and bots
+    try:
+        state = load_game()
+
+        if state is None:
+            return jsonify({"error": "No active game"}), 400
+
+        guesses = request.json.get('guesses')
+        if not isinstance(guesses, list) or len(guesses) > MAX_BATCH_GUESSES:
+            return jsonify({"error": f"guesses must be a list of at most {MAX_BATCH_GUESSES} words"}), 400
+
+        results = []
+        for guess in guesses:
+            # Guesses after the game ends are not played and get no result row
+            if state.finished:
+                break
+            feedback = play_guess(state, guess)
+            results.append({'guess': guess, 'valid': False} if feedback is None else
+                           {'guess': guess, 'valid': True, 'feedback': feedback})
+
+        save_game(state)
+
+        response_data = {
+            'results': results,
+            'guess_count': state.guess_count,
+            'game_over': state.finished,
+        }
+
+        if state.solved:
+            response_data.update({
+                'time_taken': state.elapsed(),
+                'correct': True
+            })
+
+        return jsonify(response_data)
+
+    except Exception as e:
+        print(f"Error in submit_guesses: {str(e)}")
+        return jsonify({"error": str(e)}), 500
+
 
 @app.route('/submit_score', methods=['POST'])
 #@login_required
@@ -230,105 +420,177 @@ def submit_score():
         data = request.json
         name = data.get('name')
         time = data.get('time')
-        word_length = str(data.get('wordLength'))
+        word_length = data.get('wordLength')
         language = data.get('language', 'en')
         
         if not all([name, time, word_length, language]):
             return jsonify({'error': 'Missing required fields'}), 400
         
-        response = supabase.table('wurdle_scores').select('*')\
-            .eq('word_length', word_length)\
-            .eq('language', language)\
-            .order('time')\
-            .execute()
-            
-        current_scores = response.data
+        word_length = board_length(language, word_length)
+        if word_length is None:
+            return jsonify({'error': 'Unknown language or word length'}), 400
+        
+        if isinstance(time, bool) or not isinstance(time, (int, float)) or not math.isfinite(time) or time <= 0:
+            return jsonify({'error': 'time must be a positive number of seconds'}), 400
+        
+        entry = {'name': name, 'time': time, 'word_length': word_length, 'language': language}
+        rank = None
+        done = False
+        
+        if score_writer is not None:
+            # Rank against the cached board and queue the insert; a full queue falls back to writing now
+            times = [score['time'] for score in leaderboards.get(language, word_length)]
+            if len(times) >= LEADERBOARD_SIZE and time >= times[-1]:
+                done = True
+            else:
+                row = dict(entry)
+                if score_writer.submit(row):
+                    leaderboards.record(language, word_length, row)
+                    rank = bisect_left(times, time) + 1
+                    done = True
         
-        if len(current_scores) < 20 or time < current_scores[-1]['time']:
-            supabase.table('wurdle_scores').insert({
-                'name': name,
-                'time': time,
-                'word_length': word_length,
-                'language': language
-            }).execute()
+        if not done:
+            # Only the board and the row below it are read, so the cost does not grow with the table
+            board = scores.top(language, word_length, LEADERBOARD_SIZE + 1)
+            times = [score['time'] for score in board[:LEADERBOARD_SIZE]]
             
-            if len(current_scores) >= 20:
-                response = supabase.table('wurdle_scores').select('*')\
-                    .eq('word_length', word_length)\
-                    .eq('language', language)\
-                    .order('time')\
-                    .execute()
-                new_scores = response.data
+            if len(times) < LEADERBOARD_SIZE or time < times[-1]:
+                inserted = scores.insert([dict(entry)])
+                for row in inserted:
+                    leaderboards.record(language, word_length, row)
                 
-                for score in new_scores[20:]:
-                    supabase.table('wurdle_scores')\
-                        .delete()\
-                        .eq('id', score['id'])\
-                        .execute()
-            
-            rank = 1
-            for score in current_scores:
-                if score['time'] < time:
-                    rank += 1
-            return jsonify({'rank': rank})
-            
-        return jsonify({'rank': None})
+                rank = bisect_left(times, time) + 1
+                # The rows pushed below the top 20 are deleted by id in one query, so the board keeps
+                # exactly 20 rows even when times tie at the cutoff
+                displaced = board[LEADERBOARD_SIZE - 1:]
+                if displaced:
+                    scores.delete([row['id'] for row in displaced])
+        
+        response_data = {'rank': rank}
+        response_data.update(record_history(entry))
+        return jsonify(response_data)
         
     except Exception as e:
         print(f"Error submitting score: {str(e)}")
         return jsonify({'error': 'Internal server error'}), 500
 
+@app.route('/get_scores')
+def get_all_scores():
+    # Every board of ?language= (or of all languages without it) in one response: {language: {word_length: scores}}
+    try:
+        language = request.args.get('language')
+        if language is not None and language not in WORDS:
+            return jsonify({'error': 'Unknown language'}), 404
+        snapshot, etag = leaderboards.snapshot_with_etag(language)
+        if request.if_none_match.contains_weak(etag):
+            response = app.response_class(status=304)
+        else:
+            response = jsonify(snapshot)
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+    except Exception as e:
+        print(f"Error getting scores: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
 @app.route('/get_scores/<word_length>')
 def get_scores(word_length):
     try:
         language = request.args.get('language', 'en')
-        response = supabase.table('wurdle_scores').select('*')\
-            .eq('word_length', word_length)\
-            .eq('language', language)\
-            .order('time')\
-            .limit(20)\
-            .execute()
-            
-        return jsonify(response.data)
+        word_length = board_length(language, word_length)
+        if word_length is None:
+            return jsonify({'error': 'Unknown language or word length'}), 404
+        rows, etag = leaderboards.get_with_etag(language, word_length)
+        # If-None-Match uses weak comparison, so W/ tags from compressing proxies still match
+        if request.if_none_match.contains_weak(etag):
+            response = app.response_class(status=304)
+        else:
+            response = jsonify(rows)
+        # Browsers revalidate on every view; an unchanged board costs a 304 from the cache
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
     except Exception as e:
         print(f"Error getting scores: {str(e)}")
         return jsonify({'error': 'Internal server error'}), 500
 
+@app.route('/get_scores/<word_length>/page')
+def get_scores_page(word_length):
+    # The full board beyond the top 20, fastest first; pass the previous page's 'next' back as after_time/after_id
+    try:
+        language = request.args.get('language', 'en')
+        word_length = board_length(language, word_length)
+        if word_length is None:
+            return jsonify({'error': 'Unknown language or word length'}), 404
+        limit = max(1, min(request.args.get('limit', SCORES_PAGE_SIZE, type=int), MAX_SCORES_PAGE_SIZE))
+        after_time = request.args.get('after_time', type=float)
+        after_id = request.args.get('after_id', type=int)
+        if after_time is not None and not math.isfinite(after_time):
+            return jsonify({'error': 'after_time must be a finite number'}), 400
+        after = (after_time, after_id) if after_time is not None and after_id is not None else None
+
+        rows = scores.page(language, word_length, after, limit)
+        # Ranks are left out until the rank index has been built
+        for row, rank in zip(rows, ranks.ranks(language, word_length, [row['time'] for row in rows]) or ()):
+            row['rank'] = rank
+        next_page = {'after_time': rows[-1]['time'], 'after_id': rows[-1]['id']} if len(rows) == limit else None
+        return jsonify({'scores': rows, 'next': next_page})
+    except Exception as e:
+        print(f"Error getting scores page: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+@app.route('/rank/<word_length>')
+def get_rank(word_length):
+    # Where a time stands among every time submitted for the board
+    try:
+        language = request.args.get('language', 'en')
+        word_length = board_length(language, word_length)
+        if word_length is None:
+            return jsonify({'error': 'Unknown language or word length'}), 404
+        time_taken = request.args.get('time', type=float)
+        if time_taken is None:
+            return jsonify({'error': 'Missing time'}), 400
+        if not math.isfinite(time_taken) or time_taken <= 0:
+            return jsonify({'error': 'time must be a positive number of seconds'}), 400
+
+        standing = ranks.rank(language, word_length, time_taken)
+        if standing is None:
+            return jsonify({'error': 'Ranks are not available yet'}), 503
+
+        overall_rank, players, percentile = standing
+        return jsonify({'overall_rank': overall_rank, 'players': players, 'percentile': percentile})
+    except Exception as e:
+        print(f"Error getting rank: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+@app.route('/hint')
+def hint():
+    try:
+        state = load_game()
+
+        if state is None:
+            return jsonify({"error": "No active game"}), 400
+
+        # hints needs NumPy, which is only imported once a hint or a guess asks for it
+        from hints import suggest
+        count, suggestion = suggest(state.language, state.length, state.mode, state.candidates)
+        return jsonify({'candidates': count, 'suggestion': suggestion})
+
+    except Exception as e:
+        print(f"Error in hint: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
 @app.route('/get_target_word')
 #@login_required
 def get_target_word():
-    target_word = session.get('target_word', '')
-    return jsonify({'target_word': target_word})
+    state = load_game()
+    return jsonify({'target_word': state.target_word if state else ''})
 
 # Helper functions
-def normalize_guess(word, language):
-    accented_map = {
-        'fr': {
-            'â': 'a', 'à': 'a', 'á': 'a',
-            'ê': 'e', 'é': 'e', 'è': 'e', 
-            'î': 'i', 'ï': 'i', 
-            'ô': 'o', 'ö': 'o',
-            'û': 'u', 'ü': 'u'
-        },
-        'es': {
-            'á': 'a', 'é': 'e', 'í': 'i', 'ó': 'o', 'ú': 'u', 
-            'ñ': 'n'
-        },
-        'ga': {
-            'á': 'a', 'é': 'e', 'í': 'i', 'ó': 'o', 'ú': 'u'
-        }
-    }
-
-    if language in accented_map:
-        for accented, base in accented_map[language].items():
-            word = word.replace(accented, base)
-    
-    return word
-
 def fetchDictionaryEntry(word):
     url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
     try:
-        response = requests.get(url)
+        response = http_session('api.dictionaryapi.dev').get(url, timeout=HTTP_TIMEOUT)
         response.raise_for_status()
         data = response.json()
         
@@ -343,27 +605,33 @@ def fetchDictionaryEntry(word):
         print(f"Error fetching definition: {e}")
         return f"Unable to fetch definition: {str(e)}"
 
-def compare_words(guess, target_word):
-    feedback = []
-    target_letters = list(target_word)
-    guess_letters = list(guess)
-
-    # First pass: Check for correct letters in the correct position
-    for i in range(len(target_word)):
-        if guess_letters[i] == target_letters[i]:
-            feedback.append({'letter': guess_letters[i], 'status': 'correct'})
-            target_letters[i] = None
-            guess_letters[i] = None
-        else:
-            feedback.append({'letter': guess_letters[i], 'status': 'absent'})
+def play_guess(state, guess):
+    # Feedback rows for a guess, recorded in the game state, or None when it is not a word of the right length
+    if not isinstance(guess, str):
+        return None
+    target_word = state.target_word
+    guess = unicodedata.normalize('NFC', guess.lower())
+
+    # Only guesses of the game's length are looked up, so the client cannot grow the per-length caches
+    if len(guess) != state.length:
+        return None
+
+    if guess != target_word:
+        # Accept guesses typed without accents and compare them in their dictionary spelling
+        guess = resolve_guess(state.language, guess)
 
-    # Second pass: Check for correct letters in the wrong position
-    for i in range(len(target_word)):
-        if guess_letters[i] is not None and guess_letters[i] in target_letters:
-            feedback[i]['status'] = 'present'
-            target_letters[target_letters.index(guess_letters[i])] = None
+    if guess is None or len(guess) != len(target_word):
+        return None
 
-    return feedback
+    code = pattern_code(guess, target_word)
+    state.add_guess(guess, code)
+    from hints import filter_candidates
+    state.candidates = filter_candidates(state.language, state.length, state.mode, state.candidates, guess, code)
+    return compare_words(guess, target_word)
+
+def compare_words(guess, target_word):
+    statuses = decode_pattern(pattern_code(guess, target_word), len(target_word))
+    return [{'letter': letter, 'status': status} for letter, status in zip(guess, statuses)]
 
 if __name__ == '__main__':
      app.run(debug=True, port=5000)
@@ -0,0 +1,78 @@
+# Precomputes the guess x answer feedback pattern matrix of every (language, length) word pool
+#
+# Each matrix holds one base-3 pattern code (see feedbackEngine.py) per (guess, answer) pair of the pool,
+# as uint8 up to 5 letters and uint16 beyond, and is saved as patterns/<language>-<length>-<digest>.npy
+# for memory-mapped loading. The digest identifies the pool's words, so a rerun after editing the word
+# lists only rebuilds the buckets that changed. Rows are split into chunks that a process pool fills in
+# parallel, which spreads even a single large bucket over every core.
+#
+#   python buildPatterns.py [--language en] [--processes 4]
+import argparse
+import glob
+import multiprocessing
+import os
+
+import numpy as np
+
+import wordStore
+from feedbackEngine import PATTERNS_DIR, pattern_codes, pattern_dtype, pattern_path
+
+
+def _fill(task):
+    language, length, path, start, stop = task
+    codes = wordStore.pool(language, length).codes()
+    matrix = np.load(path, mmap_mode='r+')
+    matrix[start:stop] = pattern_codes(codes[start:stop], codes)
+    matrix.flush()
+    return stop - start
+
+
+def build(languages, output, processes=None, rows=256):
+    os.makedirs(output, exist_ok=True)
+    pending = []
+    tasks = []
+    for language in languages:
+        for length in sorted(wordStore.WORDS[language]):
+            pool = wordStore.pool(language, length)
+            path = pattern_path(output, language, length, pool.digest())
+            if not len(pool):
+                continue
+            if os.path.exists(path):
+                print(f"{language} {length}: up to date")
+                continue
+
+            partial = path + '.partial'
+            np.lib.format.open_memmap(partial, mode='w+', dtype=pattern_dtype(length), shape=(len(pool), len(pool)))
+            pending.append((language, length, path, partial))
+            tasks.extend((language, length, partial, start, min(start + rows, len(pool)))
+                         for start in range(0, len(pool), rows))
+
+    if tasks:
+        with multiprocessing.Pool(processes) as workers:
+            done = 0
+            total = sum(stop - start for *_, start, stop in tasks)
+            for count in workers.imap_unordered(_fill, tasks):
+                done += count
+                print(f"\r{done}/{total} rows", end='', flush=True)
+        print()
+
+    for language, length, path, partial in pending:
+        os.replace(partial, path)
+        for stale in glob.glob(pattern_path(output, language, length, '*')):
+            if stale != path:
+                os.remove(stale)
+        print(f"{language} {length}: wrote {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Precompute feedback pattern matrices for the word index')
+    parser.add_argument('--language', action='append', help='only build this language (repeatable)')
+    parser.add_argument('--processes', type=int, help='worker processes (default: one per core)')
+    parser.add_argument('-o', '--output', default=PATTERNS_DIR, help='directory to write the matrices to')
+    args = parser.parse_args()
+
+    build(args.language or list(wordStore.WORDS), args.output, args.processes)
+
+
+if __name__ == '__main__':
+    main()
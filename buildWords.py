@@ -0,0 +1,165 @@
+# Compiles the WORDS lists from wordLists.py into the binary word index read by wordStore.py
+#
+# Each language gets its own file, words/<language>.bin, so a worker only maps the languages it serves.
+# Every (language, length) bucket stores each word once in a shared pool of fixed-width rows: one byte per
+# letter, holding the letter's position in the language's alphabet. The pool is ordered by the
+# modes a word belongs to, so every mode is a contiguous [start, stop) range of it, and words that are
+# only in ALLOWED_GUESSES sit at the end where no mode reaches them.
+#
+# Layout (little endian):
+#   header   magic, format version, bucket count, alphabet size in bytes, then the alphabet as UTF-8
+#   buckets  per length: pool size, pool offset, mode count, then (mode, start, stop) per mode
+#   data     each pool as a size x length matrix of alphabet indices
+#
+# Entries that don't fit their bucket (wrong length, characters outside the language's alphabet) are
+# reported and left out of the index.
+#
+# Run `python buildWords.py` after editing wordLists.py and commit the regenerated words/ directory.
+import argparse
+import os
+import string
+import struct
+import sys
+
+MAGIC = b'WURD'
+VERSION = 3
+HEADER = struct.Struct('<4sHHH')
+BUCKET = struct.Struct('<BIIB')
+MODE = struct.Struct('<12sII')
+
+# Same letters as LANGUAGE_ALPHABETS in static/script.js
+ALPHABETS = {
+    'en': string.ascii_lowercase,
+    'fr': string.ascii_lowercase + 'àâæçéèêëîïôœùûüÿ',
+    'es': string.ascii_lowercase + 'ñáéíóúü',
+    'ga': string.ascii_lowercase + 'áéíóú',
+}
+
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'words')
+
+
+def lint_language(language, lengths, allowed_guesses=None):
+    alphabet = set(ALPHABETS[language])
+    problems = []
+
+    def clean(length, label, word_list):
+        kept = []
+        seen = set()
+        for word in word_list:
+            word = word.strip().lower()
+            if len(word) != length:
+                problems.append(f"{language} {length} {label}: '{word}' has {len(word)} letters")
+            elif not set(word) <= alphabet:
+                problems.append(f"{language} {length} {label}: '{word}' has characters outside the alphabet")
+            elif word in seen:
+                problems.append(f"{language} {length} {label}: duplicate '{word}'")
+            else:
+                seen.add(word)
+                kept.append(word)
+        return kept
+
+    modes = {}
+    for length, mode_lists in lengths.items():
+        modes[length] = {mode: clean(length, mode, word_list) for mode, word_list in mode_lists.items()}
+        names = list(modes[length])
+        for mode in names:
+            if not modes[length][mode]:
+                problems.append(f"{language} {length} {mode}: no words left")
+        for i, mode in enumerate(names):
+            for other in names[i + 1:]:
+                if modes[length][mode] == modes[length][other]:
+                    problems.append(f"{language} {length}: '{mode}' and '{other}' are the same list")
+
+    allowed = {length: clean(length, 'allowed', word_list)
+               for length, word_list in (allowed_guesses or {}).items()}
+    return modes, allowed, problems
+
+
+def compile_language(language, lengths, allowed_guesses=None):
+    modes, allowed, problems = lint_language(language, lengths, allowed_guesses)
+
+    alphabet = ALPHABETS[language]
+    codes = {letter: i for i, letter in enumerate(alphabet)}
+    alphabet = alphabet.encode('utf-8')
+
+    buckets = []
+    for length in sorted(set(modes) | set(allowed)):
+        pool, ranges = _pool(modes.get(length, {}), allowed.get(length, []))
+        packed = bytes(codes[letter] for word in pool for letter in word)
+        buckets.append((length, len(pool), packed, ranges))
+
+    offset = HEADER.size + len(alphabet) + sum(BUCKET.size + MODE.size * len(ranges) for *_, ranges in buckets)
+    header = [HEADER.pack(MAGIC, VERSION, len(buckets), len(alphabet)), alphabet]
+    data = []
+    for length, size, packed, ranges in buckets:
+        header.append(BUCKET.pack(length, size, offset, len(ranges)))
+        for mode, (start, stop) in ranges.items():
+            header.append(MODE.pack(mode.encode('ascii'), start, stop))
+        data.append(packed)
+        offset += len(packed)
+
+    return b''.join(header + data), problems
+
+
+def _pool(modes, allowed):
+    # Group words by the modes they belong to: for ['normal', 'advanced'] that gives
+    # normal only, both, advanced only, then guess-only words
+    names = list(modes)
+    membership = {}
+    for i, mode in enumerate(names):
+        for word in modes[mode]:
+            membership.setdefault(word, set()).add(i)
+    for word in allowed:
+        membership.setdefault(word, set())
+
+    def group(word):
+        member_of = membership[word]
+        if not member_of:
+            return len(names), len(names)
+        return min(member_of), max(member_of)
+
+    pool = sorted(membership, key=group)
+    ranges = {}
+    for i, mode in enumerate(names):
+        positions = [n for n, word in enumerate(pool) if i in membership[word]]
+        start, stop = (positions[0], positions[-1] + 1) if positions else (0, 0)
+        if stop - start != len(positions):
+            raise ValueError(f"Mode '{mode}' cannot be stored as a contiguous range")
+        ranges[mode] = (start, stop)
+    return pool, ranges
+
+
+def language_path(directory, language):
+    return os.path.join(directory, f'{language}.bin')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compile wordLists.py into the binary word index')
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT, help='directory to write the index files to')
+    parser.add_argument('--strict', action='store_true', help='fail instead of dropping entries that break the lint rules')
+    args = parser.parse_args()
+
+    from wordLists import ALLOWED_GUESSES, WORDS
+
+    compiled = {}
+    failed = False
+    for language in WORDS:
+        blob, problems = compile_language(language, WORDS[language], ALLOWED_GUESSES.get(language))
+        for problem in problems:
+            print(f"lint: {problem}")
+        failed = failed or bool(problems)
+        compiled[language] = blob
+
+    if failed and args.strict:
+        sys.exit("Word lists failed lint, nothing written")
+
+    os.makedirs(args.output, exist_ok=True)
+    for language, blob in compiled.items():
+        path = language_path(args.output, language)
+        with open(path, 'wb') as f:
+            f.write(blob)
+        print(f"Wrote {len(blob)} bytes to {path}")
+
+
+if __name__ == '__main__':
+    main()
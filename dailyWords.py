@@ -0,0 +1,84 @@
+# Deterministic daily puzzles: every (language, length, mode) bucket gets a seeded schedule of targets
+#
+# Day n after DAILY_EPOCH plays position n of the bucket's schedule. A schedule cycle is a seeded
+# shuffle of the whole bucket, so no word repeats until the bucket is exhausted, and the next cycle is a
+# fresh shuffle. The shuffle is computed once per bucket and process, so looking up any day is O(1).
+# Keep WURDLE_DAILY_SEED secret: anyone with the seed and the word lists can work out the schedule. It is
+# read when a puzzle is looked up, after the app has loaded .env, and a warning is printed while the
+# public default seed is in use.
+#
+#   python dailyWords.py en 5 normal --days 365     # print the coming year's schedule
+import argparse
+import os
+import random
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+
+from dotenv import load_dotenv
+
+from wordStore import WORDS
+
+DAILY_EPOCH = date(2025, 1, 1)
+DEFAULT_DAILY_SEED = 'wurdle'
+
+_warned = False
+
+
+def daily_seed():
+    global _warned
+    seed = os.getenv('WURDLE_DAILY_SEED')
+    if seed:
+        return seed
+    if not _warned:
+        _warned = True
+        print("Warning: WURDLE_DAILY_SEED is not set, the daily schedule uses the public default seed")
+    return DEFAULT_DAILY_SEED
+
+
+def today():
+    return datetime.now(timezone.utc).date()
+
+
+def puzzle_number(day):
+    return (day - DAILY_EPOCH).days
+
+
+@lru_cache(maxsize=None)
+def _cycle(seed, language, length, mode, cycle):
+    order = list(range(len(WORDS[language][length][mode])))
+    random.Random(f'{seed}:{language}:{length}:{mode}:{cycle}').shuffle(order)
+    return order
+
+
+def daily_index(language, length, mode, day):
+    # Position of the day's target in WORDS[language][length][mode]
+    size = len(WORDS[language][length][mode])
+    cycle, position = divmod(puzzle_number(day), size)
+    return _cycle(daily_seed(), language, length, mode, cycle)[position]
+
+
+def daily_word(language, length, mode, day):
+    return WORDS[language][length][mode][daily_index(language, length, mode, day)]
+
+
+def schedule(language, length, mode, start, days):
+    return [(start + timedelta(days=n), daily_word(language, length, mode, start + timedelta(days=n)))
+            for n in range(days)]
+
+
+def main():
+    load_dotenv()
+    parser = argparse.ArgumentParser(description='Print the daily word schedule of a bucket')
+    parser.add_argument('language')
+    parser.add_argument('length', type=int)
+    parser.add_argument('mode')
+    parser.add_argument('--start', type=date.fromisoformat, default=today(), help='first day (YYYY-MM-DD)')
+    parser.add_argument('--days', type=int, default=365)
+    args = parser.parse_args()
+
+    for day, word in schedule(args.language, args.length, args.mode, args.start, args.days):
+        print(f"{day.isoformat()}  #{puzzle_number(day)}  {word}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+# Offline difficulty index: every bucket's words pre-sorted into difficulty bands for O(1) target picks
+#
+# A word's score combines how rare its letters are in its bucket, how unusual each letter is at its
+# position, how many letters repeat and, unless skipped, how many guesses the reference solver
+# (hints.play) needs for it. Each feature is standardised over the bucket before weighting. The bucket's
+# word positions are stored sorted by score and cut into equal bands, so start_game only picks a random
+# slot inside a band's range; nothing is scored at request time.
+#
+# The index lives in difficulty/<language>.json next to a digest of the words it was built from; a
+# bucket whose words have changed since is ignored until the index is rebuilt.
+#
+#   python difficulty.py [--language en] [--no-solver] [--processes 4]
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import threading
+
+import numpy as np
+
+import hints
+import wordStore
+
+BANDS = ('easy', 'medium', 'hard')
+WEIGHTS = {'letters': 0.2, 'positions': 0.2, 'repeats': 0.1, 'solver': 0.5}
+
+DIFFICULTY_DIR = os.getenv('WURDLE_DIFFICULTY_DIR',
+                           os.path.join(os.path.dirname(os.path.abspath(__file__)), 'difficulty'))
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def _index(language):
+    index = _indexes.get(language)
+    if index is None:
+        with _indexes_lock:
+            index = _indexes.get(language)
+            if index is None:
+                try:
+                    with open(os.path.join(DIFFICULTY_DIR, f'{language}.json'), encoding='utf-8') as f:
+                        index = json.load(f)
+                except FileNotFoundError:
+                    index = {}
+                _indexes[language] = index
+    return index
+
+
+def pick_index(language, length, mode, band):
+    # Position in the bucket of a random word of the given band, or None when the bucket has no up-to-date index
+    bucket = wordStore.WORDS[language][length][mode]
+    entry = _index(language).get(str(length), {}).get(mode)
+    if not entry or band not in entry['bands'] or entry['digest'] != bucket.digest():
+        return None
+    start, stop = entry['bands'][band]
+    if start == stop:
+        return None
+    return entry['order'][random.randrange(start, stop)]
+
+
+def scores(bucket, solver_guesses=None):
+    codes = bucket.codes().astype(np.intp)
+    size, length = codes.shape
+    letters = codes.max() + 1
+
+    overall = np.bincount(codes.ravel(), minlength=letters) / codes.size
+    positional = np.stack([np.bincount(codes[:, i], minlength=letters) for i in range(length)]) / size
+
+    features = {
+        'letters': -np.log(overall[codes]).mean(axis=1),
+        'positions': -np.log(positional[np.arange(length), codes]).mean(axis=1),
+        'repeats': np.array([length - len(set(row)) for row in codes.tolist()], dtype=float),
+    }
+    if solver_guesses is not None:
+        features['solver'] = np.asarray(solver_guesses, dtype=float)
+
+    total = np.zeros(size)
+    for name, values in features.items():
+        spread = values.std()
+        if spread:
+            total += WEIGHTS[name] * (values - values.mean()) / spread
+    return total
+
+
+def _solve(task):
+    language, length, mode = task
+    return task, [hints.play(language, length, mode, answer) or hints.SOLVER_GUESS_LIMIT
+                  for answer in range(len(wordStore.WORDS[language][length][mode]))]
+
+
+def build(languages, output, use_solver=True, processes=None):
+    tasks = [(language, length, mode)
+             for language in languages
+             for length, modes in sorted(wordStore.WORDS[language].items())
+             for mode, bucket in modes.items() if len(bucket)]
+
+    solver = {}
+    if use_solver:
+        with multiprocessing.Pool(processes) as workers:
+            for task, guesses in workers.imap_unordered(_solve, tasks):
+                solver[task] = guesses
+                print(f"solved {' '.join(map(str, task))}")
+
+    os.makedirs(output, exist_ok=True)
+    for language in languages:
+        index = {}
+        for task in tasks:
+            if task[0] != language:
+                continue
+            _, length, mode = task
+            bucket = wordStore.WORDS[language][length][mode]
+            order = np.argsort(scores(bucket, solver.get(task)), kind='stable')
+            cuts = np.linspace(0, len(order), len(BANDS) + 1).astype(int)
+            index.setdefault(str(length), {})[mode] = {
+                'digest': bucket.digest(),
+                'order': order.tolist(),
+                'bands': {band: [int(cuts[i]), int(cuts[i + 1])] for i, band in enumerate(BANDS)},
+            }
+
+        path = os.path.join(output, f'{language}.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, separators=(',', ':'))
+        print(f"Wrote {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the difficulty band index of the word buckets')
+    parser.add_argument('--language', action='append', help='only this language (repeatable)')
+    parser.add_argument('--no-solver', action='store_true', help='score on letter statistics only, much faster')
+    parser.add_argument('--processes', type=int, help='solver worker processes (default: one per core)')
+    parser.add_argument('-o', '--output', default=DIFFICULTY_DIR, help='directory to write the index to')
+    args = parser.parse_args()
+
+    build(args.language or list(wordStore.WORDS), args.output, not args.no_solver, args.processes)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+# Scalar Wordle feedback for one (guess, target) pair, packed into a base-3 pattern code
+#
+# Feedback rules: exact matches are 'correct' first, then each remaining guess letter, left to right, is
+# 'present' while the target still has an unmatched copy of it. A whole feedback row is packed into one
+# code: sum(status[i] * 3 ** i). pattern_code() is memoised in a bounded LRU cache; compare_words in
+# app.py only turns its code into the JSON feedback rows.
+#
+# This is all a request needs to score a guess, so it is kept apart from the NumPy batch engine
+# (feedbackEngine.py) and app startup does not import NumPy.
+from functools import lru_cache
+
+STATUSES = ('absent', 'present', 'correct')
+ABSENT, PRESENT, CORRECT = range(3)
+
+PATTERN_CACHE_SIZE = 1 << 16
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def pattern_code(guess, target):
+    unmatched = {}
+    for g, t in zip(guess, target):
+        if g != t:
+            unmatched[t] = unmatched.get(t, 0) + 1
+
+    code = 0
+    weight = 1
+    for g, t in zip(guess, target):
+        if g == t:
+            code += CORRECT * weight
+        elif unmatched.get(g):
+            code += PRESENT * weight
+            unmatched[g] -= 1
+        weight *= 3
+    return code
+
+
+def all_correct(length):
+    return 3 ** length - 1
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def decode_pattern(code, length):
+    result = []
+    for _ in range(length):
+        code, status = divmod(int(code), 3)
+        result.append(STATUSES[status])
+    return tuple(result)
@@ -0,0 +1,79 @@
+# Batch Wordle feedback over integer-coded words (see WordBucket.codes() in wordStore.py)
+#
+# The feedback rules and the base-3 pattern code are those of feedbackCodes.py, whose scalar
+# pattern_code() for a single (guess, target) pair is re-exported here.
+#
+# statuses()/pattern_codes() compute them for every pair of two integer-coded word matrices at once. Per
+# guess position a letter is present when fewer earlier non-correct guess positions hold the same letter
+# than the target has non-correct copies of it, so only letter positions are looped over.
+#
+# buildPatterns.py precomputes the full guess x answer code matrix of each (language, length) pool;
+# pattern_matrix() memory-maps it so lookups need no recomputation.
+import os
+
+import numpy as np
+
+import wordStore
+from feedbackCodes import ABSENT, CORRECT, PRESENT, STATUSES, all_correct, decode_pattern, pattern_code  # noqa: F401
+
+PATTERNS_DIR = os.getenv('WURDLE_PATTERNS_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'patterns'))
+
+_pattern_matrices = {}
+
+
+def statuses(guesses, targets):
+    # (G, L) guesses x (T, L) targets -> (G, T, L) status array
+    guesses = np.atleast_2d(np.asarray(guesses, dtype=np.uint8))
+    targets = np.atleast_2d(np.asarray(targets, dtype=np.uint8))
+    length = guesses.shape[1]
+
+    correct = guesses[:, None, :] == targets[None, :, :]
+    result = np.where(correct, CORRECT, ABSENT).astype(np.uint8)
+
+    for i in range(length):
+        letter = guesses[:, i, None]
+        unmatched = np.zeros(correct.shape[:2], dtype=np.int16)
+        for k in range(length):
+            unmatched += (targets[None, :, k] == letter) & ~correct[:, :, k]
+        earlier = np.zeros(correct.shape[:2], dtype=np.int16)
+        for j in range(i):
+            earlier += (guesses[:, j, None] == letter) & ~correct[:, :, j]
+        result[:, :, i][~correct[:, :, i] & (earlier < unmatched)] = PRESENT
+
+    return result
+
+
+def pattern_codes(guesses, targets, chunk=512):
+    # (G, L) guesses x (T, L) targets -> (G, T) uint16 base-3 pattern codes, in chunks of guesses
+    guesses = np.atleast_2d(np.asarray(guesses, dtype=np.uint8))
+    targets = np.atleast_2d(np.asarray(targets, dtype=np.uint8))
+    weights = (3 ** np.arange(guesses.shape[1])).astype(np.uint16)
+
+    codes = np.empty((len(guesses), len(targets)), dtype=np.uint16)
+    for start in range(0, len(guesses), chunk):
+        block = statuses(guesses[start:start + chunk], targets)
+        codes[start:start + chunk] = (block * weights).sum(axis=2, dtype=np.uint16)
+    return codes
+
+
+def pattern_dtype(length):
+    return np.uint8 if 3 ** length <= 256 else np.uint16
+
+
+def pattern_path(directory, language, length, digest):
+    # The pool digest is part of the name, so a matrix is never used against words it wasn't built from
+    return os.path.join(directory, f'{language}-{length}-{digest}.npy')
+
+
+def pattern_matrix(language, length):
+    # Memory-mapped pool x pool pattern codes (rows are guesses, columns answers), or None when not built
+    key = (language, length)
+    if key not in _pattern_matrices:
+        path = pattern_path(PATTERNS_DIR, language, length, wordStore.pool(language, length).digest())
+        try:
+            matrix = np.load(path, mmap_mode='r')
+        except FileNotFoundError:
+            matrix = None
+        _pattern_matrices[key] = matrix
+    return _pattern_matrices[key]
+
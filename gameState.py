@@ -0,0 +1,90 @@
+# Compact per-game state, stored in the session as one short list instead of a growing guess history
+#
+# The target is kept as its position in WORDS[language][length][mode], the start time as integer
+# milliseconds, the guesses as one concatenated string (every guess has the target's length) and their
+# feedback as base-3 pattern codes (see feedbackCodes.py). The remaining hint candidates ride along as
+# their packed blob. Saving always assigns a fresh value, so the session is marked modified every time.
+#
+# With a server-side store (sessionStore.py) the list is kept there instead and the cookie only carries
+# the game's opaque ID, which stays the same from game to game so the cookie is not re-signed per guess.
+import secrets
+import time
+
+from flask import session
+
+from feedbackCodes import all_correct
+from sessionStore import create_store
+from wordStore import WORDS
+
+MAX_GUESSES = 6
+
+_store = create_store()
+
+
+class GameState:
+    __slots__ = ('language', 'length', 'mode', 'target', 'started', 'guesses', 'codes', 'candidates', 'daily')
+
+    def __init__(self, language, length, mode, target, started=None, guesses='', codes=(), candidates=None, daily=None):
+        self.language = language
+        self.length = length
+        self.mode = mode
+        self.target = target
+        self.started = started if started is not None else int(time.time() * 1000)
+        self.guesses = guesses
+        self.codes = list(codes)
+        self.candidates = candidates
+        self.daily = daily
+
+    @property
+    def target_word(self):
+        return WORDS[self.language][self.length][self.mode][self.target]
+
+    @property
+    def guess_count(self):
+        return len(self.codes)
+
+    @property
+    def guess_list(self):
+        return [self.guesses[i:i + self.length] for i in range(0, len(self.guesses), self.length)]
+
+    @property
+    def solved(self):
+        return bool(self.codes) and self.codes[-1] == all_correct(self.length)
+
+    @property
+    def finished(self):
+        return self.solved or self.guess_count >= MAX_GUESSES
+
+    def elapsed(self):
+        return time.time() - self.started / 1000
+
+    def add_guess(self, guess, code):
+        self.guesses += guess
+        self.codes.append(code)
+
+    def dump(self):
+        return [self.language, self.length, self.mode, self.target, self.started,
+                self.guesses, self.codes, self.candidates, self.daily]
+
+    @classmethod
+    def load(cls, data):
+        return cls(*data)
+
+
+def load_game():
+    if _store is None:
+        data = session.get('game')
+    else:
+        game_id = session.get('game_id')
+        data = _store.get(game_id) if game_id else None
+    return GameState.load(data) if data else None
+
+
+def save_game(state):
+    if _store is None:
+        session['game'] = state.dump()
+        return
+    game_id = session.get('game_id')
+    if not game_id:
+        game_id = session['game_id'] = secrets.token_urlsafe(16)
+    _store.put(game_id, state.dump())
@@ -0,0 +1,128 @@
+# Remaining-candidate tracking and next-guess suggestions for /hint
+#
+# A game's candidates are the answers of its (language, length, mode) bucket still consistent with every
+# guess so far, kept in the session as a compact blob and narrowed on each submit_guess: only the
+# surviving candidates are checked against the new guess, using the precomputed pattern matrix when it
+# has been built (buildPatterns.py) and feedbackEngine otherwise.
+#
+# The suggestion is the guess whose feedback splits the candidates most evenly (highest entropy),
+# preferring a guess that could itself be the answer. play() uses it as a reference solver.
+import numpy as np
+
+import feedbackEngine
+import wordStore
+
+# Without a pattern matrix, score at most this many guesses, spread over the candidates
+FALLBACK_GUESSES = 256
+ROWS_PER_BLOCK = 512
+# The reference solver always finishes, this only guards against a bad word list
+SOLVER_GUESS_LIMIT = 30
+
+_BITSET = b'B'
+_INDICES = b'I'
+
+_openers = {}
+
+
+def encode_candidates(candidates, size):
+    # Packed bitset over the bucket or uint16 index list, whichever is smaller
+    indices = candidates.astype('<u2').tobytes() if size <= 0x10000 else None
+    mask = np.zeros(size, dtype=bool)
+    mask[candidates] = True
+    bitset = np.packbits(mask).tobytes()
+    if indices is not None and len(indices) < len(bitset):
+        return _INDICES + indices
+    return _BITSET + bitset
+
+
+def decode_candidates(blob, size):
+    # None means no guesses yet: every answer in the bucket is still possible
+    if blob is None:
+        return np.arange(size)
+    kind, data = blob[:1], blob[1:]
+    if kind == _INDICES:
+        return np.frombuffer(data, dtype='<u2').astype(np.intp)
+    return np.flatnonzero(np.unpackbits(np.frombuffer(data, dtype=np.uint8), count=size))
+
+
+def filter_candidates(language, length, mode, blob, guess, code):
+    # Keep the candidates that would have given this guess the pattern code it got
+    bucket = wordStore.WORDS[language][length][mode]
+    candidates = decode_candidates(blob, len(bucket))
+    codes = _codes_against(language, length, bucket, guess, candidates)
+    return encode_candidates(candidates[codes == code], len(bucket))
+
+
+def suggest(language, length, mode, blob):
+    bucket = wordStore.WORDS[language][length][mode]
+    if blob is None:
+        key = (language, length, mode)
+        if key not in _openers:
+            _openers[key] = _best_guess(language, length, bucket, np.arange(len(bucket)))
+        return len(bucket), _openers[key]
+
+    candidates = decode_candidates(blob, len(bucket))
+    return len(candidates), _best_guess(language, length, bucket, candidates)
+
+
+def play(language, length, mode, answer):
+    # Number of guesses the reference solver needs for the bucket's answer-th word
+    bucket = wordStore.WORDS[language][length][mode]
+    target = bucket[answer]
+    candidates = np.arange(len(bucket))
+    count, guess = suggest(language, length, mode, None)
+    for turn in range(1, SOLVER_GUESS_LIMIT + 1):
+        if guess == target:
+            return turn
+        code = feedbackEngine.pattern_code(guess, target)
+        candidates = candidates[_codes_against(language, length, bucket, guess, candidates) == code]
+        guess = _best_guess(language, length, bucket, candidates)
+    return None
+
+
+def _codes_against(language, length, bucket, guess, candidates):
+    matrix = feedbackEngine.pattern_matrix(language, length)
+    pool = wordStore.pool(language, length)
+    if matrix is not None:
+        return matrix[pool.index(guess), bucket.start + candidates]
+    encoded = np.frombuffer(wordStore.encode(wordStore.alphabet(language), guess), dtype=np.uint8)
+    return feedbackEngine.pattern_codes(encoded, bucket.codes()[candidates])[0]
+
+
+def _best_guess(language, length, bucket, candidates):
+    if len(candidates) == 0:
+        return None
+    if len(candidates) <= 2:
+        return bucket[int(candidates[0])]
+
+    pool = wordStore.pool(language, length)
+    matrix = feedbackEngine.pattern_matrix(language, length)
+    columns = bucket.start + candidates
+    if matrix is not None:
+        # Every word in the pool is a possible guess; rows are pool positions
+        guesses = np.arange(matrix.shape[0])
+    else:
+        guesses = columns[np.linspace(0, len(columns) - 1, min(len(columns), FALLBACK_GUESSES)).astype(np.intp)]
+
+    entropy = np.empty(len(guesses))
+    for start in range(0, len(guesses), ROWS_PER_BLOCK):
+        rows = guesses[start:start + ROWS_PER_BLOCK]
+        if matrix is not None:
+            codes = matrix[rows[0]:rows[-1] + 1][:, columns]
+        else:
+            codes = feedbackEngine.pattern_codes(pool.codes()[rows], bucket.codes()[candidates])
+        entropy[start:start + len(rows)] = _entropy(codes, 3 ** length)
+
+    # Break ties in favour of guesses that could win outright
+    entropy += np.isin(guesses, columns) * 1e-6
+    return pool[int(guesses[np.argmax(entropy)])]
+
+
+def _entropy(codes, patterns):
+    # Per-row histogram of feedback patterns in one bincount, offsetting each row into its own range
+    rows, total = codes.shape
+    offsets = np.arange(rows)[:, None] * patterns
+    counts = np.bincount((codes + offsets).ravel(), minlength=rows * patterns).reshape(rows, patterns)
+    p = counts / total
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return -np.where(p > 0, p * np.log2(p), 0).sum(axis=1)
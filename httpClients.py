@@ -0,0 +1,54 @@
+# Shared outbound HTTP: one pooled keep-alive client per upstream host, with connect and read timeouts
+#
+# Reusing connections saves a TCP and TLS handshake on every leaderboard and dictionary call. Pool sizes
+# should cover the worker's threads (WURDLE_HTTP_POOL_SIZE). httpx clients speak HTTP/2 when the h2
+# package is installed; requests sessions are HTTP/1.1 only.
+import os
+import threading
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+HTTP_CONNECT_TIMEOUT = float(os.getenv('WURDLE_HTTP_CONNECT_TIMEOUT', 3.05))
+HTTP_READ_TIMEOUT = float(os.getenv('WURDLE_HTTP_READ_TIMEOUT', 10))
+HTTP_POOL_SIZE = int(os.getenv('WURDLE_HTTP_POOL_SIZE', 10))
+# Idle connections are closed after this many seconds (httpx clients)
+HTTP_KEEPALIVE_EXPIRY = 60
+
+try:
+    import h2  # noqa: F401
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
+
+# For requests: (connect, read)
+HTTP_TIMEOUT = (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def session(host):
+    # Pooled requests.Session for one upstream host; pass timeout=HTTP_TIMEOUT on each call
+    client = _sessions.get(host)
+    if client is None:
+        with _sessions_lock:
+            client = _sessions.get(host)
+            if client is None:
+                client = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE)
+                client.mount('https://', adapter)
+                client.mount('http://', adapter)
+                _sessions[host] = client
+    return client
+
+
+def httpx_options():
+    # Keyword arguments for an httpx.Client (or subclass) with the shared pool and timeout settings
+    return {
+        'timeout': httpx.Timeout(HTTP_READ_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+        'limits': httpx.Limits(max_connections=HTTP_POOL_SIZE, max_keepalive_connections=HTTP_POOL_SIZE,
+                               keepalive_expiry=HTTP_KEEPALIVE_EXPIRY),
+        'http2': HTTP2,
+    }
@@ -0,0 +1,140 @@
+# Builds a language's word index straight from large word lists or frequency-ranked corpora
+#
+# Input files are read one line at a time (plain text or .gz, '-' for stdin), so corpus size doesn't
+# matter: only the words being kept are held in memory. Each line's first token is the word and lines
+# are taken to be in frequency order, most common first. Words are lowercased and NFC-normalised,
+# accented letters the language doesn't use are folded to their base letter, and anything that still
+# falls outside the alphabet or the requested lengths is skipped.
+#
+# Per length, the first --normal words become 'normal', the next --advanced become 'advanced' and, with
+# --allowed, the rest are kept as guess-only words. The result is written as words/<language>.bin.
+#
+#   python ingestWords.py fr frequencies-fr.txt.gz --normal 1500 --advanced 3000 --allowed
+import argparse
+import gzip
+import os
+import sys
+import unicodedata
+
+from buildWords import ALPHABETS, DEFAULT_OUTPUT, compile_language, language_path
+
+
+def read_lines(paths):
+    for path in paths:
+        if path == '-':
+            yield from sys.stdin
+        elif path.endswith('.gz'):
+            with gzip.open(path, 'rt', encoding='utf-8', errors='replace') as f:
+                yield from f
+        else:
+            with open(path, encoding='utf-8', errors='replace') as f:
+                yield from f
+
+
+def normalize_word(word, alphabet):
+    word = unicodedata.normalize('NFC', word.strip().lower())
+    letters = []
+    for letter in word:
+        if letter not in alphabet:
+            letter = unicodedata.normalize('NFD', letter)[0]
+            if letter not in alphabet:
+                return None
+        letters.append(letter)
+    return ''.join(letters)
+
+
+def ingest(language, lines, lengths, normal, advanced, keep_allowed=False, max_allowed=None, seed=None):
+    alphabet = set(ALPHABETS[language])
+    modes = {length: {'normal': [], 'advanced': []} for length in lengths}
+    allowed = {length: [] for length in lengths}
+    seen = {length: set() for length in lengths}
+
+    # Curated words keep their modes and count towards the quotas. A curated word may be in several modes,
+    # so they are deduplicated per mode; seen only keeps corpus words from repeating any of them
+    for length, mode_lists in (seed or {}).items():
+        if length not in modes:
+            continue
+        for mode, word_list in mode_lists.items():
+            kept = modes[length].setdefault(mode, [])
+            in_mode = set(kept)
+            for word in word_list:
+                word = normalize_word(word, alphabet)
+                if word and len(word) == length and word not in in_mode:
+                    in_mode.add(word)
+                    kept.append(word)
+                    seen[length].add(word)
+
+    def full(length):
+        if len(modes[length]['normal']) < normal or len(modes[length]['advanced']) < advanced:
+            return False
+        return not keep_allowed or (max_allowed is not None and len(allowed[length]) >= max_allowed)
+
+    for line in lines:
+        fields = line.split()
+        if not fields:
+            continue
+        word = normalize_word(fields[0], alphabet)
+        if not word or len(word) not in modes:
+            continue
+        length = len(word)
+        if word in seen[length] or full(length):
+            continue
+        seen[length].add(word)
+
+        if len(modes[length]['normal']) < normal:
+            modes[length]['normal'].append(word)
+        elif len(modes[length]['advanced']) < advanced:
+            modes[length]['advanced'].append(word)
+        elif keep_allowed:
+            allowed[length].append(word)
+
+        if all(full(length) for length in modes):
+            break
+
+    return modes, allowed
+
+
+def parse_lengths(value):
+    if '-' in value:
+        low, high = value.split('-')
+        return list(range(int(low), int(high) + 1))
+    return [int(length) for length in value.split(',')]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Stream word lists or corpora into a language word index')
+    parser.add_argument('language', choices=sorted(ALPHABETS))
+    parser.add_argument('files', nargs='+', help="text or .gz files, one word per line, most frequent first ('-' for stdin)")
+    parser.add_argument('--lengths', type=parse_lengths, default=[4, 5, 6, 7], help="e.g. 4-7 or 4,5")
+    parser.add_argument('--normal', type=int, default=2000, help='words per length for normal mode')
+    parser.add_argument('--advanced', type=int, default=2000, help='words per length for advanced mode')
+    parser.add_argument('--allowed', action='store_true', help='keep the remaining words as guess-only words')
+    parser.add_argument('--max-allowed', type=int, help='cap on guess-only words per length')
+    parser.add_argument('--merge', action='store_true', help="keep the language's curated lists from wordLists.py")
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT, help='directory to write the index file to')
+    args = parser.parse_args()
+
+    seed = None
+    if args.merge:
+        from wordLists import WORDS
+        seed = WORDS.get(args.language)
+
+    modes, allowed = ingest(args.language, read_lines(args.files), args.lengths, args.normal, args.advanced,
+                            args.allowed, args.max_allowed, seed)
+    for length in args.lengths:
+        counts = ', '.join(f"{mode} {len(word_list)}" for mode, word_list in modes[length].items())
+        print(f"{args.language} {length}: {counts}, allowed {len(allowed[length])}")
+
+    blob, problems = compile_language(args.language, modes, allowed)
+    for problem in problems:
+        print(f"lint: {problem}")
+
+    os.makedirs(args.output, exist_ok=True)
+    path = language_path(args.output, args.language)
+    with open(path, 'wb') as f:
+        f.write(blob)
+    print(f"Wrote {len(blob)} bytes to {path}")
+
+
+if __name__ == '__main__':
+    main()
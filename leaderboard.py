@@ -0,0 +1,141 @@
+# In-process cache of the top-20 boards, one per (language, word_length)
+#
+# A board younger than LEADERBOARD_TTL seconds is served straight from memory. An older one is still
+# served while a single background thread refreshes it (stale-while-revalidate), and when several
+# requests miss the same board at once only the first queries upstream while the rest wait for its
+# result (single-flight). submit_score writes its new row through to the cached board, so a player sees
+# their own score without waiting for the TTL. Upstream load depends on the number of boards, not players.
+#
+# A snapshot of every board of a language (or of all languages) is cached the same way, as one entry
+# fetched with one upstream query, and receives the same write-through.
+#
+# Each board carries an ETag derived from the names and times it shows, so it only changes when the top
+# 20 does, and every worker computes the same tag for the same board.
+import hashlib
+import json
+import os
+import threading
+import time
+
+LEADERBOARD_SIZE = 20
+LEADERBOARD_TTL = float(os.getenv('WURDLE_LEADERBOARD_TTL', 30))
+# How long a request waits for another request's upstream fetch of the same board
+FETCH_WAIT = 10
+
+
+def _shown(rows):
+    return [[score['name'], float(score['time'])] for score in rows]
+
+
+def board_etag(rows):
+    # rows is one board's list of scores or a snapshot's {language: {word_length: scores}}
+    if isinstance(rows, dict):
+        shown = {language: {length: _shown(board) for length, board in boards.items()}
+                 for language, boards in rows.items()}
+    else:
+        shown = _shown(rows)
+    return hashlib.sha1(json.dumps(shown, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+
+class _Board:
+    __slots__ = ('rows', 'etag', 'fetched', 'written')
+
+    def __init__(self, rows, fetched):
+        self.fetched = fetched
+        self.written = 0
+        self.update(rows)
+
+    def update(self, rows):
+        if getattr(self, 'rows', None) != rows:
+            self.rows = rows
+            self.etag = board_etag(rows)
+
+
+class LeaderboardCache:
+    def __init__(self, fetch, fetch_snapshot=None, ttl=LEADERBOARD_TTL, size=LEADERBOARD_SIZE):
+        # fetch(language, word_length) returns the board's rows ordered by time;
+        # fetch_snapshot(language or None) returns {language: {word_length: rows}}
+        self._fetch = fetch
+        self._fetch_snapshot = fetch_snapshot
+        self.ttl = ttl
+        self.size = size
+        self._boards = {}
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def get(self, language, word_length):
+        return self.get_with_etag(language, word_length)[0]
+
+    def get_with_etag(self, language, word_length):
+        board = self._get((language, str(word_length)), lambda: self._fetch(language, str(word_length)))
+        return board.rows, board.etag
+
+    def snapshot_with_etag(self, language=None):
+        # Snapshots are keyed apart from boards by a None word length
+        board = self._get((language, None), lambda: self._fetch_snapshot(language))
+        return board.rows, board.etag
+
+    def record(self, language, word_length, row):
+        # Write-through of a newly inserted score; an entry that is not cached is fetched on its next read
+        word_length = str(word_length)
+        now = time.monotonic()
+        with self._lock:
+            board = self._boards.get((language, word_length))
+            if board is not None:
+                board.update(self._insert(board.rows, row))
+                board.written = now
+            for key in ((language, None), (None, None)):
+                snapshot = self._boards.get(key)
+                if snapshot is not None:
+                    boards = dict(snapshot.rows.get(language, {}))
+                    boards[word_length] = self._insert(boards.get(word_length, []), row)
+                    snapshot.update({**snapshot.rows, language: boards})
+                    snapshot.written = now
+
+    def _insert(self, rows, row):
+        return sorted(rows + [row], key=lambda score: score['time'])[:self.size]
+
+    def _get(self, key, fetch):
+        with self._lock:
+            board = self._boards.get(key)
+            if board is not None:
+                if time.monotonic() - board.fetched > self.ttl and key not in self._inflight:
+                    self._inflight[key] = threading.Event()
+                    threading.Thread(target=self._refresh_quietly, args=(key, fetch), daemon=True).start()
+                return board
+            done = self._inflight.get(key)
+            if done is None:
+                self._inflight[key] = threading.Event()
+
+        if done is None:
+            return self._refresh(key, fetch)
+
+        done.wait(FETCH_WAIT)
+        with self._lock:
+            board = self._boards.get(key)
+        if board is None:
+            raise RuntimeError(f"Leaderboard {key} is unavailable")
+        return board
+
+    def _refresh(self, key, fetch):
+        started = time.monotonic()
+        try:
+            rows = fetch()
+            with self._lock:
+                board = self._boards.get(key)
+                if board is None:
+                    board = self._boards[key] = _Board(rows, started)
+                elif board.written < started:
+                    board.update(rows)
+                    board.fetched = started
+                # else a score was written through while fetching: keep it, the entry refreshes again on its next read
+                return board
+        finally:
+            with self._lock:
+                self._inflight.pop(key).set()
+
+    def _refresh_quietly(self, key, fetch):
+        try:
+            self._refresh(key, fetch)
+        except Exception as e:
+            print(f"Error refreshing leaderboard {key}: {str(e)}")
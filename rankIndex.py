@@ -0,0 +1,96 @@
+# In-memory order statistics over every submitted time, for ranks and percentiles beyond the top 20
+#
+# Each (language, word_length) board keeps its times in a sorted array, so a rank is one bisect. The
+# arrays are built from the full score history (scoreStore times_since, read in id order in batches) by
+# a background thread started at boot, and then kept current: a worker adds the rows it inserts itself
+# at once and, every RANK_SYNC_INTERVAL seconds, pulls the rows other workers inserted since the last id
+# it has seen. Syncs never run inside a request; until the first build succeeds ranks are None.
+import bisect
+import os
+import threading
+import time
+
+RANK_SYNC_INTERVAL = float(os.getenv('WURDLE_RANK_SYNC_INTERVAL', 30))
+SYNC_BATCH = 1000
+
+
+class RankIndex:
+    def __init__(self, fetch_since, interval=RANK_SYNC_INTERVAL):
+        # fetch_since(last_id, limit) returns history rows with a larger id, in id order
+        self._fetch_since = fetch_since
+        self.interval = interval
+        self._times = {}
+        self._last_id = 0
+        # Ids added locally that the next sync will see again
+        self._added = set()
+        self._attempted = None
+        self.ready = False
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+
+    def start(self):
+        # Build in the background so a slow or missing history never holds up boot or a request
+        self._sync_in_background()
+
+    def add(self, row):
+        with self._lock:
+            # A sync may already have pulled the row in
+            if row['id'] > self._last_id:
+                self._insert(row)
+                self._added.add(row['id'])
+
+    def rank(self, language, word_length, time_taken, pending=()):
+        # (rank, players, percentile) of a time, also counting times not written to the history yet
+        if not self._check():
+            return None
+        with self._lock:
+            times = self._times.get((language, str(word_length)), [])
+            rank = bisect.bisect_left(times, time_taken) + sum(1 for other in pending if other < time_taken) + 1
+            players = max(len(times) + len(pending), 1)
+        # Share of players with the same or a slower time
+        return rank, players, round(100 * (players - rank + 1) / players, 1)
+
+    def ranks(self, language, word_length, times):
+        # Rank of each time in one pass under the lock, for a page of scores
+        if not self._check():
+            return None
+        with self._lock:
+            board = self._times.get((language, str(word_length)), [])
+            return [bisect.bisect_left(board, time_taken) + 1 for time_taken in times]
+
+    def _check(self):
+        # Syncs at most once per interval, which also retries a failed build
+        if self._attempted is None or time.monotonic() - self._attempted > self.interval:
+            self._sync_in_background()
+        return self.ready
+
+    def _sync_in_background(self):
+        # Only one sync at a time; the lock is released by the sync thread
+        if self._sync_lock.acquire(blocking=False):
+            self._attempted = time.monotonic()
+            threading.Thread(target=self._sync_quietly, daemon=True).start()
+
+    def _sync_quietly(self):
+        try:
+            self._sync()
+        except Exception as e:
+            print(f"Error syncing rank index: {str(e)}")
+        finally:
+            self._sync_lock.release()
+
+    def _sync(self):
+        while True:
+            rows = self._fetch_since(self._last_id, SYNC_BATCH)
+            with self._lock:
+                for row in rows:
+                    if row['id'] in self._added:
+                        self._added.discard(row['id'])
+                    else:
+                        self._insert(row)
+                    self._last_id = max(self._last_id, row['id'])
+            if len(rows) < SYNC_BATCH:
+                break
+        self.ready = True
+
+    def _insert(self, row):
+        bisect.insort(self._times.setdefault((row['language'], str(row['word_length'])), []), row['time'])
@@ -0,0 +1,178 @@
+# Storage of leaderboard scores behind one small interface
+#
+#   top(language, word_length, limit)   best rows of a board, fastest first (earliest first on ties)
+#   insert(rows)                        inserts rows and returns them as stored
+#   delete(ids)                         deletes rows by id, e.g. those pushed off a board
+#   boards(language, limit)             best rows of every board of a language (None: all languages)
+#                                       in one query, ordered by language, word_length and time
+#
+# Every submitted time, on the board or not, is also kept in a history table (wurdle_times, same
+# columns) for ranks, percentiles and paging beyond the top 20:
+#
+#   add_times(rows)                     inserts history rows and returns them as stored
+#   times_since(last_id, limit)         history rows with a larger id, in id order
+#   page(language, word_length, after, limit)
+#                                       a board's history rows after the (time, id) cursor, fastest first
+#
+# WURDLE_SCORE_STORE picks the backend: 'supabase' (the wurdle_scores table, needs SUPABASE_URL and
+# SUPABASE_KEY) or 'sqlite', a local database file (WURDLE_SCORES_DB) in WAL mode with a composite
+# (language, word_length, time) index, for single-machine deployments and offline runs. By default
+# Supabase is used when its credentials are set and SQLite otherwise. word_length is stored as text.
+import os
+import sqlite3
+import threading
+
+from httpClients import httpx_options
+
+DEFAULT_SCORES_DB = 'scores.db'
+# PostgREST honours a single order parameter, so multi-column orders go in one comma separated value
+_BY_TIME = 'time.asc,id.asc'
+
+
+class SupabaseScores:
+    def __init__(self, url, key):
+        # Imported here so SQLite-only deployments do not need the Supabase client
+        from postgrest.utils import SyncClient
+        from supabase import create_client
+        self._client = create_client(url, key)
+        # Swap the REST session for one with the shared pool limits, timeouts and HTTP/2 when available
+        postgrest = self._client.postgrest
+        default = postgrest.session
+        postgrest.session = SyncClient(base_url=default.base_url, headers=default.headers, **httpx_options())
+        default.close()
+
+    def top(self, language, word_length, limit):
+        response = self._client.table('wurdle_scores').select('*')\
+            .eq('word_length', word_length)\
+            .eq('language', language)\
+            .order(_BY_TIME)\
+            .limit(limit)\
+            .execute()
+        return response.data
+
+    def insert(self, rows):
+        return self._client.table('wurdle_scores').insert(rows).execute().data
+
+    def boards(self, language, limit):
+        # PostgREST has no per-group limit, but submit_score keeps every board at its top rows anyway
+        query = self._client.table('wurdle_scores').select('*')
+        if language is not None:
+            query = query.eq('language', language)
+        response = query.order(f'language.asc,word_length.asc,{_BY_TIME}').execute()
+        return [row for rows in _group(response.data).values() for row in rows[:limit]]
+
+    def add_times(self, rows):
+        return self._client.table('wurdle_times').insert(rows).execute().data
+
+    def times_since(self, last_id, limit):
+        response = self._client.table('wurdle_times').select('id,language,word_length,time')\
+            .gt('id', last_id)\
+            .order('id')\
+            .limit(limit)\
+            .execute()
+        return response.data
+
+    def page(self, language, word_length, after, limit):
+        query = self._client.table('wurdle_times').select('*')\
+            .eq('word_length', word_length)\
+            .eq('language', language)
+        if after is not None:
+            after_time, after_id = after
+            query = query.gte('time', after_time)
+            query.params = query.params.add('or', f'(time.gt.{after_time},id.gt.{after_id})')
+        return query.order(_BY_TIME).limit(limit).execute().data
+
+    def delete(self, ids):
+        self._client.table('wurdle_scores').delete().in_('id', list(ids)).execute()
+
+
+class SQLiteScores:
+    def __init__(self, path=DEFAULT_SCORES_DB):
+        self.path = path
+        self._local = threading.local()
+        with self._connection() as db:
+            for table in ('wurdle_scores', 'wurdle_times'):
+                db.execute(f'CREATE TABLE IF NOT EXISTS {table} ('
+                           "id INTEGER PRIMARY KEY, name TEXT NOT NULL, time REAL NOT NULL CHECK (typeof(time) = 'real'), "
+                           'word_length TEXT NOT NULL, language TEXT NOT NULL, '
+                           'created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP)')
+                db.execute(f'CREATE INDEX IF NOT EXISTS {table}_board ON {table} (language, word_length, time)')
+
+    def _connection(self):
+        db = getattr(self._local, 'db', None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=5)
+            db.row_factory = sqlite3.Row
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('PRAGMA synchronous=NORMAL')
+            self._local.db = db
+        return db
+
+    def top(self, language, word_length, limit):
+        rows = self._connection().execute(
+            'SELECT * FROM wurdle_scores WHERE language = ? AND word_length = ? ORDER BY time, id LIMIT ?',
+            (language, str(word_length), limit)).fetchall()
+        return [dict(row) for row in rows]
+
+    def insert(self, rows, table='wurdle_scores'):
+        inserted = []
+        with self._connection() as db:
+            for row in rows:
+                cursor = db.execute(f'INSERT INTO {table} (name, time, word_length, language) '
+                                    'VALUES (?, ?, ?, ?) RETURNING *',
+                                    (row['name'], float(row['time']), str(row['word_length']), row['language']))
+                inserted.append(dict(cursor.fetchone()))
+        return inserted
+
+    def add_times(self, rows):
+        return self.insert(rows, 'wurdle_times')
+
+    def times_since(self, last_id, limit):
+        rows = self._connection().execute(
+            'SELECT id, language, word_length, time FROM wurdle_times WHERE id > ? ORDER BY id LIMIT ?',
+            (last_id, limit)).fetchall()
+        return [dict(row) for row in rows]
+
+    def page(self, language, word_length, after, limit):
+        # The (time, id) row value comparison walks the board index from the cursor on
+        cursor = 'AND (time, id) > (?, ?)' if after is not None else ''
+        rows = self._connection().execute(
+            f'SELECT * FROM wurdle_times WHERE language = ? AND word_length = ? {cursor} ORDER BY time, id LIMIT ?',
+            (language, str(word_length)) + (tuple(after) if after is not None else ()) + (limit,)).fetchall()
+        return [dict(row) for row in rows]
+
+    def boards(self, language, limit):
+        where = 'WHERE language = ?' if language is not None else ''
+        rows = self._connection().execute(
+            'SELECT * FROM (SELECT *, ROW_NUMBER() OVER (PARTITION BY language, word_length ORDER BY time, id) AS place '
+            f'FROM wurdle_scores {where}) WHERE place <= ? ORDER BY language, word_length, time, id',
+            ((language,) if language is not None else ()) + (limit,)).fetchall()
+        return [{key: row[key] for key in row.keys() if key != 'place'} for row in rows]
+
+    def delete(self, ids):
+        ids = list(ids)
+        with self._connection() as db:
+            db.execute(f"DELETE FROM wurdle_scores WHERE id IN ({', '.join('?' * len(ids))})", ids)
+
+
+def _group(rows):
+    boards = {}
+    for row in rows:
+        boards.setdefault((row['language'], str(row['word_length'])), []).append(row)
+    return boards
+
+
+def create_score_store(kind=None):
+    # The environment is read here, at call time, so settings loaded from .env by the app apply
+    kind = kind or os.getenv('WURDLE_SCORE_STORE')
+    url = os.getenv('SUPABASE_URL')
+    key = os.getenv('SUPABASE_KEY')
+    if kind is None:
+        kind = 'supabase' if url and key else 'sqlite'
+    if kind == 'supabase':
+        if not all([url, key]):
+            raise Exception("WURDLE_SCORE_STORE=supabase needs SUPABASE_URL and SUPABASE_KEY")
+        return SupabaseScores(url, key)
+    if kind == 'sqlite':
+        return SQLiteScores(os.getenv('WURDLE_SCORES_DB', DEFAULT_SCORES_DB))
+    raise Exception(f"Unknown WURDLE_SCORE_STORE {kind!r}")
@@ -0,0 +1,113 @@
+# Write-behind queue for score inserts (WURDLE_SCORE_WRITE_BEHIND=1)
+#
+# submit_score ranks a time against the cached board and answers at once; accepted rows wait here until
+# a background thread hands them to insert(rows) in batches, when SCORE_BATCH_SIZE rows are waiting or
+# the oldest has waited SCORE_FLUSH_INTERVAL seconds. A failed insert is retried with exponential backoff
+# and its rows stay pending, so they are still merged into freshly fetched boards (see pending()). Once
+# the insert succeeds the rows stop being pending and after(inserted rows) runs once, best effort; it is
+# never retried, so a failure there cannot insert the batch twice. At interpreter
+# exit, including a gunicorn worker's graceful shutdown, whatever is pending is flushed before exiting.
+import atexit
+import os
+import threading
+import time
+
+SCORE_QUEUE_SIZE = int(os.getenv('WURDLE_SCORE_QUEUE_SIZE', 1000))
+SCORE_BATCH_SIZE = int(os.getenv('WURDLE_SCORE_BATCH_SIZE', 50))
+SCORE_FLUSH_INTERVAL = float(os.getenv('WURDLE_SCORE_FLUSH_INTERVAL', 2))
+RETRY_DELAY = 0.5
+MAX_RETRY_DELAY = 30
+# Attempts at a final flush on shutdown before giving up and logging the rows
+SHUTDOWN_ATTEMPTS = 3
+
+
+class ScoreWriter:
+    def __init__(self, insert, after=None, max_size=SCORE_QUEUE_SIZE, batch_size=SCORE_BATCH_SIZE,
+                 interval=SCORE_FLUSH_INTERVAL):
+        self._insert = insert
+        self._after = after
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.interval = interval
+        self._queued = []
+        self._flushing = []
+        self._oldest = None
+        self._closed = False
+        self._thread = None
+        self._wake = threading.Condition()
+
+    def submit(self, row):
+        # False when the queue is full (or closed) and the caller should write synchronously
+        with self._wake:
+            if self._closed or len(self._queued) >= self.max_size:
+                return False
+            if self._thread is None:
+                # Started on first use so a forking server starts it in each worker
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+            if not self._queued:
+                self._oldest = time.monotonic()
+            self._queued.append(row)
+            if len(self._queued) >= self.batch_size:
+                self._wake.notify()
+            return True
+
+    def pending(self, language=None, word_length=None):
+        # Rows not yet written, optionally only one language's or one board's
+        with self._wake:
+            return [row for row in self._flushing + self._queued
+                    if language in (None, row['language']) and word_length in (None, row['word_length'])]
+
+    def close(self):
+        with self._wake:
+            if self._closed:
+                return
+            self._closed = True
+            self._wake.notify()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _next_batch(self):
+        with self._wake:
+            while not self._closed and (len(self._queued) < self.batch_size and
+                                        (not self._queued or time.monotonic() - self._oldest < self.interval)):
+                timeout = self.interval - (time.monotonic() - self._oldest) if self._queued else None
+                self._wake.wait(timeout)
+            batch = self._queued[:self.batch_size]
+            del self._queued[:self.batch_size]
+            self._oldest = time.monotonic() if self._queued else None
+            self._flushing = batch
+            return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch:
+                self._flush(batch)
+            with self._wake:
+                if self._closed and not self._queued:
+                    return
+
+    def _flush(self, batch):
+        delay = RETRY_DELAY
+        attempt = 0
+        inserted = None
+        while inserted is None:
+            attempt += 1
+            try:
+                inserted = self._insert(batch)
+            except Exception as e:
+                print(f"Error writing {len(batch)} scores (attempt {attempt}): {str(e)}")
+                if self._closed and attempt >= SHUTDOWN_ATTEMPTS:
+                    print(f"Dropping scores after shutdown retries: {batch}")
+                    break
+                time.sleep(delay)
+                delay = min(delay * 2, MAX_RETRY_DELAY)
+        with self._wake:
+            self._flushing = []
+        if inserted is not None and self._after is not None:
+            try:
+                self._after(inserted)
+            except Exception as e:
+                print(f"Error after writing {len(batch)} scores: {str(e)}")
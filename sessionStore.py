@@ -0,0 +1,105 @@
+# Server-side storage of game state, keyed by an opaque ID that is the only thing kept in the cookie
+#
+# WURDLE_SESSION_STORE picks the backend:
+#   cookie  (default) the whole game rides in Flask's signed session cookie, as on serverless hosts
+#   memory  an in-process LRU with a TTL, for a single worker
+#   sqlite  a SQLite database in WAL mode (WURDLE_SESSION_DB) that several workers on one box share
+# Games idle for longer than WURDLE_SESSION_TTL seconds are dropped.
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from flask.json.tag import TaggedJSONSerializer
+
+SESSION_TTL = 24 * 60 * 60
+SESSION_DB = 'sessions.db'
+MEMORY_MAX_GAMES = 100000
+# Expired rows are swept on roughly one write in this many
+SQLITE_PURGE_EVERY = 256
+
+
+class MemoryStore:
+    def __init__(self, max_entries=MEMORY_MAX_GAMES, ttl=SESSION_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, data = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return data
+
+    def put(self, key, data):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class SQLiteStore:
+    def __init__(self, path=SESSION_DB, ttl=SESSION_TTL):
+        self.path = path
+        self.ttl = ttl
+        self._serializer = TaggedJSONSerializer()
+        self._local = threading.local()
+        self._writes = 0
+        with self._connection() as db:
+            db.execute('CREATE TABLE IF NOT EXISTS games (id TEXT PRIMARY KEY, data TEXT NOT NULL, expires REAL NOT NULL)')
+            db.execute('CREATE INDEX IF NOT EXISTS games_expires ON games (expires)')
+
+    def _connection(self):
+        # One connection per thread; WAL lets readers in other workers carry on during a write
+        db = getattr(self._local, 'db', None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=5)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('PRAGMA synchronous=NORMAL')
+            self._local.db = db
+        return db
+
+    def get(self, key):
+        row = self._connection().execute('SELECT data FROM games WHERE id = ? AND expires >= ?',
+                                         (key, time.time())).fetchone()
+        return self._serializer.loads(row[0]) if row else None
+
+    def put(self, key, data):
+        now = time.time()
+        with self._connection() as db:
+            db.execute('INSERT OR REPLACE INTO games (id, data, expires) VALUES (?, ?, ?)',
+                       (key, self._serializer.dumps(data), now + self.ttl))
+            self._writes += 1
+            if self._writes % SQLITE_PURGE_EVERY == 0:
+                db.execute('DELETE FROM games WHERE expires < ?', (now,))
+
+    def delete(self, key):
+        with self._connection() as db:
+            db.execute('DELETE FROM games WHERE id = ?', (key,))
+
+
+def create_store(kind=None):
+    # None means keep games in the cookie session. The environment is read here, at call time, so
+    # settings loaded from .env by the app apply
+    kind = kind or os.getenv('WURDLE_SESSION_STORE', 'cookie')
+    ttl = int(os.getenv('WURDLE_SESSION_TTL', SESSION_TTL))
+    if kind == 'memory':
+        return MemoryStore(int(os.getenv('WURDLE_SESSION_MAX_GAMES', MEMORY_MAX_GAMES)), ttl)
+    if kind == 'sqlite':
+        return SQLiteStore(os.getenv('WURDLE_SESSION_DB', SESSION_DB), ttl)
+    if kind != 'cookie':
+        print(f"Unknown WURDLE_SESSION_STORE {kind!r}, keeping games in the cookie")
+    return None
@@ -0,0 +1,77 @@
+# Plays every answer of every word bucket with the reference solver (hints.play) across a process pool
+#
+# Reports, per (language, length, mode) bucket, the distribution of guesses per game, the average and
+# the share of games that need more than six guesses (a lost game for a student), plus overall
+# throughput. Use it to spot buckets that are too hard and to catch slowdowns in the feedback path.
+# Build the pattern matrices first (buildPatterns.py) or the solver falls back to computing feedback.
+#
+#   python solverBenchmark.py --language en --length 5 --processes 4
+import argparse
+import multiprocessing
+import time
+from collections import Counter
+
+import hints
+import wordStore
+
+MAX_GUESSES = 6
+GAMES_PER_TASK = 50
+
+
+def _play_range(task):
+    language, length, mode, answers = task
+    return (language, length, mode), [hints.play(language, length, mode, answer) for answer in answers]
+
+
+def _tasks(languages, lengths, modes, every):
+    for language in languages:
+        for length, buckets in sorted(wordStore.WORDS[language].items()):
+            if lengths and length not in lengths:
+                continue
+            for mode, bucket in buckets.items():
+                if modes and mode not in modes:
+                    continue
+                answers = range(0, len(bucket), every)
+                for i in range(0, len(answers), GAMES_PER_TASK):
+                    yield language, length, mode, answers[i:i + GAMES_PER_TASK]
+
+
+def report(results, elapsed):
+    games = 0
+    turns = 0
+    for (language, length, mode), outcomes in sorted(results.items()):
+        played = Counter(outcome if outcome is not None else 0 for outcome in outcomes)
+        solved = [outcome for outcome in outcomes if outcome is not None]
+        failures = sum(1 for outcome in outcomes if outcome is None or outcome > MAX_GUESSES)
+        average = sum(solved) / len(solved) if solved else 0
+        distribution = ' '.join(f"{n}:{played[n]}" for n in range(1, MAX_GUESSES + 1))
+        over = len(outcomes) - sum(played[n] for n in range(1, MAX_GUESSES + 1))
+        print(f"{language} {length} {mode:<9} games {len(outcomes):>5}  avg {average:.2f}  "
+              f"{distribution} >{MAX_GUESSES}:{over}  fail {100 * failures / len(outcomes):.1f}%")
+        games += len(outcomes)
+        turns += sum(solved)
+
+    print(f"{games} games, {turns} guesses in {elapsed:.1f}s: "
+          f"{games / elapsed:.1f} games/s, {turns / elapsed:.1f} guesses/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the reference solver over whole word buckets')
+    parser.add_argument('--language', action='append', help='only this language (repeatable)')
+    parser.add_argument('--length', type=int, action='append', help='only this word length (repeatable)')
+    parser.add_argument('--mode', action='append', help='only this mode (repeatable)')
+    parser.add_argument('--every', type=int, default=1, help='play every n-th answer only, for a quick run')
+    parser.add_argument('--processes', type=int, help='worker processes (default: one per core)')
+    args = parser.parse_args()
+
+    tasks = list(_tasks(args.language or list(wordStore.WORDS), args.length, args.mode, args.every))
+    results = {}
+    started = time.perf_counter()
+    with multiprocessing.Pool(args.processes) as workers:
+        for bucket, outcomes in workers.imap_unordered(_play_range, tasks):
+            results.setdefault(bucket, []).extend(outcomes)
+    report(results, time.perf_counter() - started)
+
+
+if __name__ == '__main__':
+    main()
@@ -58,12 +58,18 @@ function initializeEventListeners() {
         // Initialize with default language
         selectedLanguage = languageSelect.value;
         initializeAlphabetGrid();
+        updateWordLengthOptions(selectedLanguage);
 
         // Handle language change
         languageSelect.addEventListener('change', function() {
             handleLanguageChange(this.value);
         });
 
+        // Only offer the modes that have words at the chosen length
+        wordLengthSelect.addEventListener('change', function() {
+            updateModeOptions(languageSelect.value, this.value);
+        });
+
         // Start game button listener
         const startButton = document.getElementById('start-game');
         startButton.addEventListener('click', startGame);
@@ -282,27 +288,66 @@ function handleLanguageChange(language) {
     updateWordLengthOptions(language);
 }
 
+// Lengths and modes that have words ({wordLength: modes}), fetched once per language
+const wordBuckets = {};
+
+function loadWordBuckets(language) {
+    if (!wordBuckets[language]) {
+        wordBuckets[language] = fetch(`/word_buckets/${language}`)
+            .then(response => response.json())
+            .then(buckets => {
+                if (buckets.error) {
+                    throw new Error(buckets.error);
+                }
+                return buckets;
+            });
+        // Let a later call retry a failed fetch
+        wordBuckets[language].catch(() => delete wordBuckets[language]);
+    }
+    return wordBuckets[language];
+}
+
 function updateWordLengthOptions(language) {
-    const languageLengths = {
-        'en': [4, 5, 6, 7],
-        'ga': [4, 5, 6],
-        'fr': [4, 5, 6],
-        'es': [4, 5, 6]
-    };
+    // Lengths come from the server's word buckets, so empty ones are never offered
+    loadWordBuckets(language)
+        .then(buckets => {
+            // The player may have switched language while the buckets were loading
+            if (document.getElementById('language').value !== language) {
+                return;
+            }
+            const wordLengthSelect = document.getElementById('word-length');
+            const currentLength = wordLengthSelect.value;
+            wordLengthSelect.innerHTML = '';
+
+            Object.keys(buckets).forEach(length => {
+                const option = document.createElement('option');
+                option.value = length;
+                option.textContent = `${length} Letters`;
+                if (length === currentLength) {
+                    option.selected = true;
+                }
+                wordLengthSelect.appendChild(option);
+            });
 
-    const wordLengthSelect = document.getElementById('word-length');
-    const currentLength = wordLengthSelect.value;
-    wordLengthSelect.innerHTML = '';
+            updateModeOptions(language, wordLengthSelect.value);
+        })
+        .catch(error => console.error('Error loading word lengths:', error));
+}
 
-    languageLengths[language].forEach(length => {
-        const option = document.createElement('option');
-        option.value = length;
-        option.textContent = `${length} Letters`;
-        if (length === parseInt(currentLength) && languageLengths[language].includes(parseInt(currentLength))) {
-            option.selected = true;
-        }
-        wordLengthSelect.appendChild(option);
-    });
+function updateModeOptions(language, length) {
+    loadWordBuckets(language)
+        .then(buckets => {
+            const modes = buckets[length] || [];
+            const modeSelect = document.getElementById('mode');
+
+            Array.from(modeSelect.options).forEach(option => {
+                option.disabled = !modes.includes(option.value);
+            });
+            if (modeSelect.selectedOptions[0].disabled && modes.length) {
+                modeSelect.value = modes[0];
+            }
+        })
+        .catch(error => console.error('Error loading word modes:', error));
 }
 
 function submitGuess() {
@@ -343,6 +388,12 @@ function submitGuess() {
             throw new Error(data.error);
         }
 
+        if (data.valid === false) {
+            alert('Not in word list.');
+            guessInput.select();
+            return;
+        }
+
         const guessesDiv = document.getElementById('guesses');
         const currentGuessRow = guessesDiv.children[currentRow];
 
@@ -490,10 +541,16 @@ function showGameOver(timeTaken, targetWord) {
     gameOverMessage.appendChild(gameOverContent);
 }
 
+// Every board of the language, fetched once each time the high scores are opened
+let scoresSnapshot = null;
+
 function showHighScores(initialWordLength = 5) {
     const modal = document.getElementById('high-scores-modal');
     modal.style.display = 'block';
 
+    scoresSnapshot = fetch(`/get_scores?language=${selectedLanguage}`)
+        .then(response => response.json());
+
     document.querySelectorAll('.tab-button').forEach(tab => {
         tab.classList.remove('active');
         if (tab.dataset.length === initialWordLength.toString()) {
@@ -520,9 +577,12 @@ function loadScoresForLength(wordLength, language) {
         'es': 'Español'
     };
 
-    fetch(`/get_scores/${wordLength}?language=${language}`)
-        .then(response => response.json())
-        .then(scores => {
+    scoresSnapshot
+        .then(boards => {
+            if (boards.error) {
+                throw new Error(boards.error);
+            }
+            const scores = (boards[language] || {})[wordLength] || [];
             const scoresList = document.getElementById('high-scores-list');
             
             const languageName = languageNames[language];
@@ -0,0 +1,59 @@
+# The batch (statuses) and scalar (pattern_code) feedback must agree with the original two-pass compare_words,
+# duplicate letters included: hints, the pattern matrices, the solver and the difficulty index all rely on it
+import random
+
+import numpy as np
+
+from feedbackCodes import decode_pattern, pattern_code
+from feedbackEngine import STATUSES, statuses
+
+# Few letters, so most pairs repeat letters in the guess, the target or both
+LETTERS = 'abcde'
+
+
+def compare_words(guess, target_word):
+    # The original feedback from app.py, kept as the reference
+    feedback = []
+    target_letters = list(target_word)
+    guess_letters = list(guess)
+
+    for i in range(len(target_word)):
+        if guess_letters[i] == target_letters[i]:
+            feedback.append('correct')
+            target_letters[i] = None
+            guess_letters[i] = None
+        else:
+            feedback.append('absent')
+
+    for i in range(len(target_word)):
+        if guess_letters[i] is not None and guess_letters[i] in target_letters:
+            feedback[i] = 'present'
+            target_letters[target_letters.index(guess_letters[i])] = None
+
+    return feedback
+
+
+def random_words(count, length, seed):
+    rng = random.Random(seed)
+    return [''.join(rng.choice(LETTERS) for _ in range(length)) for _ in range(count)]
+
+
+def encode(words):
+    return np.array([[LETTERS.index(letter) for letter in word] for word in words], dtype=np.uint8)
+
+
+def test_statuses_match_compare_words_for_every_pair():
+    for length in (4, 5, 6, 7):
+        words = random_words(150, length, length)
+        result = statuses(encode(words), encode(words))
+        for g, guess in enumerate(words):
+            for t, target in enumerate(words):
+                assert [STATUSES[status] for status in result[g, t]] == compare_words(guess, target), (guess, target)
+
+
+def test_pattern_code_matches_compare_words():
+    rng = random.Random(0)
+    for _ in range(200000):
+        length = rng.randint(4, 7)
+        guess, target = (''.join(rng.choice(LETTERS) for _ in range(length)) for _ in range(2))
+        assert list(decode_pattern(pattern_code(guess, target), length)) == compare_words(guess, target), (guess, target)
@@ -1914,7 +1914,8 @@ WORDS = {
         7: {
             'normal': ['pouvoir', 'vouloir', 'prendre', 'falloir', 'trouver', 'laisser', 'arriver', 'appeler', 'arrêter', 'comment', 'quelque', 'essayer', 'revenir', 'bonjour', 'rentrer', 'oublier', 'écouter', 'devenir', 'dernier', 'voiture', 'changer', 'excuser', 'affaire', 'combien', 'travail', 'famille', 'premier', 'occuper', 'marcher', 'envoyer', 'montrer', 'asseoir', 'pendant', 'espérer', 'désoler', 'semaine', 'acheter', 'chambre', 'quitter', 'emmener', 'toucher', 'manquer', 'mauvais', 'heureux', 'docteur', 'suffire', 'nouveau', 'sembler', 'compter', 'endroit', 'décider', 'tourner', 'pleurer', 'instant', 'service', 'plaisir', 'bientôt', 'coucher', 'presque', 'content', "d'abord", 'journée', 'ramener', 'enlever', 'choisir', 'musique', 'mariage', 'chanter', 'bonsoir', 'frapper', 'ignorer', 'parfois', 'tromper', 'surtout', 'refuser', 'partout', 'médecin', 'rapport', 'exister', 'souvent', 'lumière', 'hôpital', 'réussir', 'bizarre', 'honneur', 'habiter', 'ensuite', 'pousser', 'général', 'million', 'seconde', 'épouser', 'message', 'inviter', 'courant', 'journal', 'sérieux', 'assurer', 'silence', 'victime', 'meurtre', 'traiter', 'blesser', 'colonel', 'certain', 'dégager', 'risquer', 'répéter', 'mériter', 'réponse', 'village', 'avancer', 'reposer', 'exemple', 'charger', 'obliger', 'fenêtre', 'prouver', 'couvrir', 'obtenir', 'cuisine', 'conseil', 'étrange', 'mission', 'chanson', 'spécial', 'compris', 'couleur', 'poisson', 'intérêt', 'retirer', 'liberté', 'dossier', 'bonheur', 'prévoir', 'système', 'capable', 'douleur', 'libérer', 'société', 'adresse', 'oreille', 'deviner', 'inutile', 'manière', 'stupide', 'retenir', 'étudier', 'courage', 'secours', 'contact', 'engager', 'vacance', 'là-haut', 'machine', 'réparer', 'présent', 'séparer', 'maladie', 'désirer', 'travers', 'dommage', 'traîner', 'diriger', 'morceau', 'demande', 'grandir', 'baisser', 'monstre', 'ennuyer', 'patient', 'cerveau', 'remplir', 'planète', 'mémoire', 'magasin', 'attaque', 'puisque', 'parfait', 'refaire', 'couteau', 'enquête', 'coincer', 'malheur', 'miracle', 'réunion', 'environ', 'chasser', 'attirer', 'chapeau', 'allumer', 'respect', 'écraser', 'sorcier', 'sourire', 'honnête', 'énerver', 'réalité', 'étonner', 'superbe', 'méchant', 'contrat', 'déposer', 'urgence', 'accuser', 'terrain', 'nourrir', 'presser', 'arrière', 'reculer', 'entendu', 'costume', 'anglais', 'justice', 'défense', 'nerveux', 'connard', 'moindre', 'tableau', 'menacer', 'lorsque', 'fantôme', 'soigner', 'cadavre', 'rigoler', 'volonté', 'quelles', 'joindre', 'horreur', 'voyager', 'passage', 'sommeil', 'flingue', 'article', 'faillir', 'marquer', 'château', 'chemise', 'abattre', 'majesté', 'énergie', 'cellule', 'bouffer', 'arrivée', 'profond', 'annuler', 'confier', 'théâtre', 'éclater', 'appuyer', 'artiste', 'vitesse', 'manteau', 'naturel', 'enfoiré', 'relever', 'chaleur', 'ajouter', 'couille', 'bloquer', 'aveugle', 'veiller', 'planter', 'millier', 'prudent', 'esclave', 'menteur', 'peindre', 'fatigué', 'marrant', 'affreux', 'inquiet', 'visiter', 'saigner', 'glisser', 'curieux', 'univers', 'embêter', 'opinion', 'passion', 'fortune', 'lunette', 'essence', 'paradis', 'enfance', 'science', 'échange', 'rivière', 'révéler', 'évident', 'suspect', 'admirer', 'théorie', 'serpent', 'plonger', 'gardien', 'célèbre', 'concert', 'médical', 'avertir', 'employé', 'échouer', 'éternel', 'feuille', 'hésiter', 'station', 'citoyen', 'amusant', 'complet', 'couloir', 'qualité', 'effacer', 'briller', 'croiser', 'envoler', 'suivant', 'produit', 'décrire', 'origine', 'mystère', 'exciter', 'cracher', 'réduire', 'vaincre', 'royaume', 'préféré', 'sergent', 'suicide', 'monnaie', 'chiffre', 'vampire', 'repérer', 'fromage', 'souffle', 'magique', 'italien', 'secteur', 'salaire', 'baigner', 'colline', 'établir', 'traître', 'émotion', 'fournir', 'période', 'pointer', 'épuiser', 'furieux', 'creuser', 'attente', 'violent', 'méthode', 'écarter', 'musical', 'chinois', 'sauvage', 'boucler', 'balader', 'gratuit', 'inconnu', 'élément', 'bagnole', 'ouvrier', 'annonce', 'imposer', 'piscine', 'absurde', 'estomac', 'épreuve', 'aimable', 'analyse', 'divorce', 'serveur', 'rejeter', 'danseur', 'achever', 'absence', 'pourrir', 'surface', 'culture', 'honorer', 'facture', 'délicat', 'associé', 'soucier', 'exposer', 'bourrer', 'comédie', 'cabinet', 'étendre', 'au-delà', 'chagrin', 'domaine', 'immense', 'placard', 'estimer', 'renfort', 'moderne', 'tension', 'craquer', 'serment', 'soudain', 'réserve', 'publier', 'grimper', 'réjouir', 'draguer', 'appétit', 'tournée', 'diamant', 'légende', 'liaison', 'section', 'version', 'hauteur', 'collier', 'illégal', 'tempête', 'dévorer', 'drapeau', 'mesurer', 'sincère', 'bagarre', 'correct', 'contrer', 'secouer', 'cingler', 'soutien', 'démolir', 'boisson', 'progrès', 'liquide', 'parking', 'opposer', 'central', 'culotte', 'dessous', 'branche', 'cravate', 'dresser', 'pension', 'pasteur', 'évacuer', 'injuste', 'envahir', 'épisode', 'diplôme', 'positif', 'plateau', 'peintre', 'matière', 'atelier', 'automne', 'pencher', 'féminin', 'douceur', 'vendeur', 'couvent', 'missile', 'marquis', 'baleine', 'langage', 'brigade', 'dispute', 'gonfler', 'séduire', 'hommage', 'boucher', 'panique', 'tricher', 'négatif', 'fragile', 'tremper', 'lecture', 'congrès', 'galerie', 'braquer', 'dominer', 'afin de', 'discret', 'minable', 'soupçon', 'enculer', 'doubler', 'suprême', 'adopter', 'terreur', 'claquer', 'plainte', 'symbole', 'maximum', 'faucher', 'ceux-là', 'dignité', 'larguer', 'crainte', 'exercer', 'auberge', 'figurer', 'chariot'],
             'advanced': ['pouvoir', 'vouloir', 'prendre', 'falloir', 'trouver', 'laisser', 'arriver', 'appeler', 'arrêter', 'comment', 'quelque', 'essayer', 'revenir', 'bonjour', 'rentrer', 'oublier', 'écouter', 'devenir', 'dernier', 'voiture', 'changer', 'excuser', 'affaire', 'combien', 'travail', 'famille', 'premier', 'occuper', 'marcher', 'envoyer', 'montrer', 'asseoir', 'pendant', 'espérer', 'désoler', 'semaine', 'acheter', 'chambre', 'quitter', 'emmener', 'toucher', 'manquer', 'mauvais', 'heureux', 'docteur', 'suffire', 'nouveau', 'sembler', 'compter', 'endroit', 'décider', 'tourner', 'pleurer', 'instant', 'service', 'plaisir', 'bientôt', 'coucher', 'presque', 'content', "d'abord", 'journée', 'ramener', 'enlever', 'choisir', 'musique', 'mariage', 'chanter', 'bonsoir', 'frapper', 'ignorer', 'parfois', 'tromper', 'surtout', 'refuser', 'partout', 'médecin', 'rapport', 'exister', 'souvent', 'lumière', 'hôpital', 'réussir', 'bizarre', 'honneur', 'habiter', 'ensuite', 'pousser', 'général', 'million', 'seconde', 'épouser', 'message', 'inviter', 'courant', 'journal', 'sérieux', 'assurer', 'silence', 'victime', 'meurtre', 'traiter', 'blesser', 'colonel', 'certain', 'dégager', 'risquer', 'répéter', 'mériter', 'réponse', 'village', 'avancer', 'reposer', 'exemple', 'charger', 'obliger', 'fenêtre', 'prouver', 'couvrir', 'obtenir', 'cuisine', 'conseil', 'étrange', 'mission', 'chanson', 'spécial', 'compris', 'couleur', 'poisson', 'intérêt', 'retirer', 'liberté', 'dossier', 'bonheur', 'prévoir', 'système', 'capable', 'douleur', 'libérer', 'société', 'adresse', 'oreille', 'deviner', 'inutile', 'manière', 'stupide', 'retenir', 'étudier', 'courage', 'secours', 'contact', 'engager', 'vacance', 'là-haut', 'machine', 'réparer', 'présent', 'séparer', 'maladie', 'désirer', 'travers', 'dommage', 'traîner', 'diriger', 'morceau', 'demande', 'grandir', 'baisser', 'monstre', 'ennuyer', 'patient', 'cerveau', 'remplir', 'planète', 'mémoire', 'magasin', 'attaque', 'puisque', 'parfait', 'refaire', 'couteau', 'enquête', 'coincer', 'malheur', 'miracle', 'réunion', 'environ', 'chasser', 'attirer', 'chapeau', 'allumer', 'respect', 'écraser', 'sorcier', 'sourire', 'honnête', 'énerver', 'réalité', 'étonner', 'superbe', 'méchant', 'contrat', 'déposer', 'urgence', 'accuser', 'terrain', 'nourrir', 'presser', 'arrière', 'reculer', 'entendu', 'costume', 'anglais', 'justice', 'défense', 'nerveux', 'connard', 'moindre', 'tableau', 'menacer', 'lorsque', 'fantôme', 'soigner', 'cadavre', 'rigoler', 'volonté', 'quelles', 'joindre', 'horreur', 'voyager', 'passage', 'sommeil', 'flingue', 'article', 'faillir', 'marquer', 'château', 'chemise', 'abattre', 'majesté', 'énergie', 'cellule', 'bouffer', 'arrivée', 'profond', 'annuler', 'confier', 'théâtre', 'éclater', 'appuyer', 'artiste', 'vitesse', 'manteau', 'naturel', 'enfoiré', 'relever', 'chaleur', 'ajouter', 'couille', 'bloquer', 'aveugle', 'veiller', 'planter', 'millier', 'prudent', 'esclave', 'menteur', 'peindre', 'fatigué', 'marrant', 'affreux', 'inquiet', 'visiter', 'saigner', 'glisser', 'curieux', 'univers', 'embêter', 'opinion', 'passion', 'fortune', 'lunette', 'essence', 'paradis', 'enfance', 'science', 'échange', 'rivière', 'révéler', 'évident', 'suspect', 'admirer', 'théorie', 'serpent', 'plonger', 'gardien', 'célèbre', 'concert', 'médical', 'avertir', 'employé', 'échouer', 'éternel', 'feuille', 'hésiter', 'station', 'citoyen', 'amusant', 'complet', 'couloir', 'qualité', 'effacer', 'briller', 'croiser', 'envoler', 'suivant', 'produit', 'décrire', 'origine', 'mystère', 'exciter', 'cracher', 'réduire', 'vaincre', 'royaume', 'préféré', 'sergent', 'suicide', 'monnaie', 'chiffre', 'vampire', 'repérer', 'fromage', 'souffle', 'magique', 'italien', 'secteur', 'salaire', 'baigner', 'colline', 'établir', 'traître', 'émotion', 'fournir', 'période', 'pointer', 'épuiser', 'furieux', 'creuser', 'attente', 'violent', 'méthode', 'écarter', 'musical', 'chinois', 'sauvage', 'boucler', 'balader', 'gratuit', 'inconnu', 'élément', 'bagnole', 'ouvrier', 'annonce', 'imposer', 'piscine', 'absurde', 'estomac', 'épreuve', 'aimable', 'analyse', 'divorce', 'serveur', 'rejeter', 'danseur', 'achever', 'absence', 'pourrir', 'surface', 'culture', 'honorer', 'facture', 'délicat', 'associé', 'soucier', 'exposer', 'bourrer', 'comédie', 'cabinet', 'étendre', 'au-delà', 'chagrin', 'domaine', 'immense', 'placard', 'estimer', 'renfort', 'moderne', 'tension', 'craquer', 'serment', 'soudain', 'réserve', 'publier', 'grimper', 'réjouir', 'draguer', 'appétit', 'tournée', 'diamant', 'légende', 'liaison', 'section', 'version', 'hauteur', 'collier', 'illégal', 'tempête', 'dévorer', 'drapeau', 'mesurer', 'sincère', 'bagarre', 'correct', 'contrer', 'secouer', 'cingler', 'soutien', 'démolir', 'boisson', 'progrès', 'liquide', 'parking', 'opposer', 'central', 'culotte', 'dessous', 'branche', 'cravate', 'dresser', 'pension', 'pasteur', 'évacuer', 'injuste', 'envahir', 'épisode', 'diplôme', 'positif', 'plateau', 'peintre', 'matière', 'atelier', 'automne', 'pencher', 'féminin', 'douceur', 'vendeur', 'couvent', 'missile', 'marquis', 'baleine', 'langage', 'brigade', 'dispute', 'gonfler', 'séduire', 'hommage', 'boucher', 'panique', 'tricher', 'négatif', 'fragile', 'tremper', 'lecture', 'congrès', 'galerie', 'braquer', 'dominer', 'afin de', 'discret', 'minable', 'soupçon', 'enculer', 'doubler', 'suprême', 'adopter', 'terreur', 'claquer', 'plainte', 'symbole', 'maximum', 'faucher', 'ceux-là', 'dignité', 'larguer', 'crainte', 'exercer', 'auberge', 'figurer', 'chariot']
-        },
+        }
+    },
     'es': {  # Spanish
         4: {
             'normal': ['para', 'como', 'este', 'pero', 'esta', 'todo', 'está', 'cada', 'bien', 'hace', 'país', 'vida', 'esto', 'sólo', 'otro', 'caso', 'cual', 'tres', 'otra', 'dijo', 'sido', 'ante', 'debe', 'solo', 'sino', 'algo', 'días', 'nada', 'poco', 'será', 'tipo', 'toda', 'pues', 'casa', 'unos', 'ello', 'tema', 'cómo', 'agua', 'ella', 'creo', 'zona', 'bajo', 'tras', 'casi', 'dice', 'aquí', 'hizo', 'lado', 'obra', 'base', 'buen', 'ayer', 'esos', 'plan', 'paso', 'hora', 'dios', 'tuvo', 'área', 'luis', 'cabo', 'idea', 'mayo', 'haya', 'modo', 'edad', 'real', 'alto', 'mano', 'etc.', 'cosa', 'unas'],
@@ -1933,6 +1934,9 @@ WORDS = {
             'advanced': ['también', 'trabajo', 'durante', 'general', 'siempre', 'primera', 'después', 'sistema', 'momento', 'nuestro', 'nuestra', 'algunos', 'acuerdo', 'empresa', 'partido', 'proceso', 'gracias', 'calidad', 'quienes', 'embargo', 'público', 'derecho', 'estamos', 'ejemplo', 'tenemos', 'estados', 'grandes', 'mercado', 'persona', 'segundo', 'sentido', 'posible', 'mujeres', 'familia', 'algunas', 'pública', 'estudio', 'control', 'gestión', 'incluso', 'cultura', 'segunda', 'mundial', 'conocer', 'jóvenes', 'primero', 'espacio', 'capital', 'escuela', 'mayoría', 'consejo', 'minutos', 'octubre', 'permite', 'podemos', 'últimos', 'federal', 'próximo', 'materia', 'central', 'alumnos', 'humanos', 'domingo', 'mejores', 'interés']
         }
     }
-    }
 }
 
+
+
+# Extra words accepted as guesses but never picked as a target word: {language: {length: [words]}}
+ALLOWED_GUESSES = {}
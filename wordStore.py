@@ -0,0 +1,243 @@
+# Read-only view over the binary word index produced by buildWords.py
+#
+# Each language's index file is memory-mapped the first time that language is used and words are
+# decoded from their packed rows on demand, so importing this module costs nothing, a worker only maps the
+# languages it actually serves and the lists never live in the worker as Python objects.
+# WordBucket.codes() exposes a bucket as a zero-copy NumPy matrix of alphabet indices for bulk scans.
+# WORDS keeps the old wordLists shape: WORDS[language][length][mode] is a sequence of words, each mode
+# being a range over the (language, length) pool that holds every word once.
+# is_valid_guess() checks guesses against a per-(language, length) hash set built once and shared by all requests,
+# and resolve_guess() also maps a guess typed without accents to its dictionary spelling in one lookup.
+import hashlib
+import mmap
+import os
+import threading
+import unicodedata
+from collections.abc import Mapping, Sequence
+
+from buildWords import BUCKET, DEFAULT_OUTPUT, HEADER, MAGIC, MODE, VERSION, language_path
+
+WORDS_DIR = os.getenv('WURDLE_WORDS_DIR', DEFAULT_OUTPUT)
+
+_languages = {}
+_languages_lock = threading.Lock()
+_guess_sets = {}
+_fold_tables = {}
+_folded_indexes = {}
+
+
+class WordBucket(Sequence):
+    def __init__(self, buffer, offset, count, length, alphabet, start=0):
+        self._buffer = buffer
+        self._offset = offset
+        self._count = count
+        self._length = length
+        self._alphabet = alphabet
+        # Position of the first word in the (language, length) pool
+        self.start = start
+        self._digest = None
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._count))]
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError('word index out of range')
+        start = self._offset + i * self._length
+        return ''.join(self._alphabet[code] for code in self._buffer[start:start + self._length])
+
+    def index(self, word):
+        import numpy as np
+        encoded = encode(self._alphabet, word)
+        if encoded is not None and len(encoded) == self._length and self._count:
+            matches = np.flatnonzero((self.codes() == np.frombuffer(encoded, dtype=np.uint8)).all(axis=1))
+            if len(matches):
+                return int(matches[0])
+        raise ValueError(f"'{word}' is not in the bucket")
+
+    def __contains__(self, word):
+        try:
+            self.index(word)
+        except ValueError:
+            return False
+        return True
+
+    def codes(self):
+        # count x length uint8 matrix over the mapped index, no copy
+        import numpy as np
+        return np.frombuffer(self._buffer, dtype=np.uint8, count=self._count * self._length,
+                             offset=self._offset).reshape(self._count, self._length)
+
+    def digest(self):
+        # Changes whenever the bucket's words or their order change
+        if self._digest is None:
+            data = self._buffer[self._offset:self._offset + self._count * self._length]
+            self._digest = hashlib.sha1(self._alphabet.encode('utf-8') + bytes(data)).hexdigest()[:16]
+        return self._digest
+
+
+class _WordsView(Mapping):
+    def __getitem__(self, language):
+        words, pools, alphabet = _load(language)
+        return words
+
+    def __contains__(self, language):
+        return language in available_languages()
+
+    def __iter__(self):
+        return iter(available_languages())
+
+    def __len__(self):
+        return len(available_languages())
+
+
+def available_languages():
+    try:
+        return sorted(name[:-len('.bin')] for name in os.listdir(WORDS_DIR) if name.endswith('.bin'))
+    except FileNotFoundError:
+        from wordLists import WORDS as source
+        return list(source)
+
+
+def _open_buffer(language):
+    path = language_path(WORDS_DIR, language)
+    try:
+        with open(path, 'rb') as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except FileNotFoundError:
+        # No compiled index (e.g. a fresh checkout): compile the source lists in memory instead
+        from buildWords import compile_language
+        from wordLists import ALLOWED_GUESSES, WORDS as source
+        if language not in source:
+            raise KeyError(language)
+        print(f"Word index {path} not found, compiling wordLists.py")
+        blob, problems = compile_language(language, source[language], ALLOWED_GUESSES.get(language))
+        return blob
+
+
+def _parse(buffer, language):
+    magic, version, count, alphabet_size = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC or version != VERSION:
+        raise Exception(f"Unsupported word index format for language '{language}'")
+
+    position = HEADER.size + alphabet_size
+    alphabet = bytes(buffer[HEADER.size:position]).decode('utf-8')
+    words = {}
+    pools = {}
+    for _ in range(count):
+        length, size, offset, mode_count = BUCKET.unpack_from(buffer, position)
+        position += BUCKET.size
+        pools[length] = WordBucket(buffer, offset, size, length, alphabet)
+        words[length] = {}
+        for _ in range(mode_count):
+            mode, start, stop = MODE.unpack_from(buffer, position)
+            position += MODE.size
+            mode = mode.rstrip(b'\0').decode('ascii')
+            words[length][mode] = WordBucket(buffer, offset + start * length, stop - start, length, alphabet, start)
+    return words, pools, alphabet
+
+
+def _load(language):
+    entry = _languages.get(language)
+    if entry is None:
+        with _languages_lock:
+            entry = _languages.get(language)
+            if entry is None:
+                entry = _languages[language] = _parse(_open_buffer(language), language)
+    return entry
+
+
+def guess_set(language, length):
+    key = (language, length)
+    words = _guess_sets.get(key)
+    if words is None:
+        modes, pools, alphabet = _load(language)
+        if length not in pools:
+            # The guess length is up to the client, so lengths without words are not cached
+            return frozenset()
+        words = _guess_sets.setdefault(key, frozenset(pools[length]))
+    return words
+
+
+def pool(language, length):
+    # Every word of the given length, guess-only words included; mode buckets are ranges of it
+    modes, pools, letters = _load(language)
+    return pools[length]
+
+
+def alphabet(language):
+    words, pools, letters = _load(language)
+    return letters
+
+
+def encode(alphabet, word):
+    # Alphabet indices of the word's letters, or None if it uses a letter outside the alphabet
+    try:
+        return bytes(alphabet.index(letter) for letter in word)
+    except ValueError:
+        return None
+
+
+def is_valid_guess(language, guess):
+    return guess in guess_set(language, len(guess))
+
+
+def fold_table(language):
+    # str.translate table taking every accented letter of the language to its base letter
+    table = _fold_tables.get(language)
+    if table is None:
+        folds = {}
+        for letter in alphabet(language):
+            base = unicodedata.normalize('NFD', letter)[0]
+            if base != letter:
+                folds[letter] = base
+        table = _fold_tables.setdefault(language, str.maketrans(folds))
+    return table
+
+
+def fold(language, word):
+    return word.translate(fold_table(language))
+
+
+def folded_index(language, length):
+    # Accentless spelling -> dictionary spelling, for every word whose accentless form is unambiguous
+    key = (language, length)
+    index = _folded_indexes.get(key)
+    if index is None:
+        modes, pools, letters = _load(language)
+        if length not in pools:
+            return {}
+        index = {}
+        ambiguous = set()
+        for word in guess_set(language, length):
+            folded = fold(language, word)
+            if folded in index:
+                ambiguous.add(folded)
+            index[folded] = word
+        for folded in ambiguous:
+            del index[folded]
+        index = _folded_indexes.setdefault(key, index)
+    return index
+
+
+def resolve_guess(language, guess):
+    # Dictionary spelling of the guess, which may have been typed without its accents, or None
+    guess = unicodedata.normalize('NFC', guess)
+    if is_valid_guess(language, guess):
+        return guess
+    return folded_index(language, len(guess)).get(fold(language, guess))
+
+
+def preload(languages):
+    # Map the given languages and build their guess sets and folded indexes up front, e.g. at worker boot
+    for language in languages:
+        words, pools, letters = _load(language)
+        for length in pools:
+            folded_index(language, length)
+
+
+WORDS = _WordsView()